@@ -1,8 +1,11 @@
 # app.py
 
+import asyncio
+import json
 import logging
 from contextlib import asynccontextmanager
 
+import httpx
 from fasthtml import ft
 from fasthtml.common import FastHTML
 from fastapi import Request
@@ -10,17 +13,38 @@ from fastapi.responses import JSONResponse, RedirectResponse
 from os import getenv
 from typing import Optional
 
-from app.i18n import t, set_language
+from app.i18n import (
+    LanguageMiddleware,
+    enable_telemetry,
+    set_default_language,
+    t,
+    telemetry,
+)
+from app.i18n.watcher import watch_strings
 from app.pages.home import home_page
-from app.pages.tasks import tasks_page, handle_task_form
+from app.pages.tasks import tasks_page, handle_task_form, render_task_list
 from app.pages.all_tasks import all_tasks_page, render_tasks_list
-from app.pages.categories import categories_page
+from app.pages.categories import categories_page, render_categories_list
 from app.pages.tags import tags_page
 from app.pages.next import next_page
 from app.pages.notifications import notifications_page
 from app.pages.settings import settings_page
-from app.utils.backend import BackendClient, BackendUnavailableError
-from app.utils.components import shell, error_message
+from app.utils.backend import (
+    BackendClient,
+    BackendUnavailableError,
+    build_lookup_maps,
+)
+from app.utils.resilience import RetryPolicy
+from app.utils.components import (
+    conditional_fragment,
+    error_message,
+    shell,
+    task_card_cache,
+)
+from app.utils.compression import CompressionMiddleware
+from app.utils.concurrency import gather_within
+from app.utils.deadline import DeadlineMiddleware, clamp
+from app.utils.static import assets
 
 logger = logging.getLogger("fridai.frontend")
 
@@ -28,15 +52,97 @@ logger = logging.getLogger("fridai.frontend")
 # Configuration
 BACKEND_URL = getenv("BACKEND_URL", "http://localhost:8000")
 VERSION = "2.0.0-vibe"
+# Budget for serving one request; X-Request-Timeout may only shorten it
+REQUEST_DEADLINE_SECONDS = float(getenv("REQUEST_DEADLINE_SECONDS", "10"))
+STATS_TIMEOUT_SECONDS = float(getenv("STATS_TIMEOUT_SECONDS", "5"))
+SYSTEM_INFO_BUDGET_SECONDS = float(getenv("SYSTEM_INFO_BUDGET_SECONDS", "3"))
+SYSTEM_INFO_CALL_TIMEOUT_SECONDS = float(
+    getenv("SYSTEM_INFO_CALL_TIMEOUT_SECONDS", "2")
+)
+
+# Server-side first paint: embed initial data in page responses when the
+# backend answers within the budget, instead of a hx-trigger=load round trip
+SSR_FIRST_PAINT = getenv("SSR_FIRST_PAINT", "false").lower() in ("1", "true", "yes")
+SSR_BUDGET_SECONDS = float(getenv("SSR_BUDGET_SECONDS", "0.25"))
+
+# Streaming pages: flush the skeleton at once, stream slow sections after it
+STREAM_PAGES = getenv("STREAM_PAGES", "false").lower() in ("1", "true", "yes")
+STREAM_BUDGET_SECONDS = float(getenv("STREAM_BUDGET_SECONDS", "5"))
+
+# Response compression (zstd/br/gzip, negotiated per request)
+COMPRESSION_MIN_SIZE = int(getenv("COMPRESSION_MIN_SIZE", "500"))
+# Share of one core compression may use; 0 removes the cap
+COMPRESSION_CPU_BUDGET = float(getenv("COMPRESSION_CPU_BUDGET", "0.5"))
+# Per media type level overrides, e.g. {"text/html": {"gzip": 4}}
+COMPRESSION_LEVELS = json.loads(getenv("COMPRESSION_LEVELS", "{}"))
+
+# Categories/tags change rarely; serve them from a short-lived cache
+REFERENCE_TTL_SECONDS = float(getenv("REFERENCE_TTL_SECONDS", "30"))
+REFERENCE_STALE_SECONDS = float(getenv("REFERENCE_STALE_SECONDS", "300"))
+
+# Connection pool and per-phase timeouts for backend calls
+BACKEND_MAX_CONNECTIONS = int(getenv("BACKEND_MAX_CONNECTIONS", "100"))
+BACKEND_MAX_KEEPALIVE = int(getenv("BACKEND_MAX_KEEPALIVE", "20"))
+BACKEND_KEEPALIVE_EXPIRY = float(getenv("BACKEND_KEEPALIVE_EXPIRY", "5"))
+BACKEND_CONNECT_TIMEOUT = float(getenv("BACKEND_CONNECT_TIMEOUT", "5"))
+BACKEND_READ_TIMEOUT = float(getenv("BACKEND_READ_TIMEOUT", "30"))
+BACKEND_WRITE_TIMEOUT = float(getenv("BACKEND_WRITE_TIMEOUT", "30"))
+BACKEND_POOL_TIMEOUT = float(getenv("BACKEND_POOL_TIMEOUT", "5"))
+BACKEND_HTTP2 = getenv("BACKEND_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Fail fast after repeated backend failures instead of waiting on timeouts
+BACKEND_BREAKER_THRESHOLD = int(getenv("BACKEND_BREAKER_THRESHOLD", "5"))
+BACKEND_BREAKER_RESET_SECONDS = float(getenv("BACKEND_BREAKER_RESET_SECONDS", "15"))
+
+# Opt-in retries for idempotent calls (1 attempt = no retries) and hedged reads
+BACKEND_RETRY_ATTEMPTS = int(getenv("BACKEND_RETRY_ATTEMPTS", "1"))
+BACKEND_RETRY_BASE_DELAY = float(getenv("BACKEND_RETRY_BASE_DELAY", "0.05"))
+BACKEND_RETRY_MAX_DELAY = float(getenv("BACKEND_RETRY_MAX_DELAY", "1"))
+BACKEND_RETRY_BUDGET_RATIO = float(getenv("BACKEND_RETRY_BUDGET_RATIO", "0.1"))
+BACKEND_HEDGE = getenv("BACKEND_HEDGE", "false").lower() in ("1", "true", "yes")
+
+# Recompile strings_*.yaml when they change on disk (development)
+I18N_HOT_RELOAD = getenv("I18N_HOT_RELOAD", "false").lower() in ("1", "true", "yes")
+# Count t() lookups, misses and interpolation failures for /metrics
+I18N_TELEMETRY = getenv("I18N_TELEMETRY", "false").lower() in ("1", "true", "yes")
+if I18N_TELEMETRY:
+    enable_telemetry()
 
 # Initialize backend client (created before lifespan so routes can reference it)
-backend = BackendClient(BACKEND_URL)
+backend = BackendClient(
+    BACKEND_URL,
+    reference_ttl=REFERENCE_TTL_SECONDS,
+    reference_stale_ttl=REFERENCE_STALE_SECONDS,
+    limits=httpx.Limits(
+        max_connections=BACKEND_MAX_CONNECTIONS,
+        max_keepalive_connections=BACKEND_MAX_KEEPALIVE,
+        keepalive_expiry=BACKEND_KEEPALIVE_EXPIRY,
+    ),
+    timeout=httpx.Timeout(
+        connect=BACKEND_CONNECT_TIMEOUT,
+        read=BACKEND_READ_TIMEOUT,
+        write=BACKEND_WRITE_TIMEOUT,
+        pool=BACKEND_POOL_TIMEOUT,
+    ),
+    http2=BACKEND_HTTP2,
+    breaker_threshold=BACKEND_BREAKER_THRESHOLD,
+    breaker_reset_timeout=BACKEND_BREAKER_RESET_SECONDS,
+    retry_policy=RetryPolicy(
+        max_attempts=BACKEND_RETRY_ATTEMPTS,
+        base_delay=BACKEND_RETRY_BASE_DELAY,
+        max_delay=BACKEND_RETRY_MAX_DELAY,
+        budget_ratio=BACKEND_RETRY_BUDGET_RATIO,
+    ),
+    hedge=BACKEND_HEDGE,
+)
 
 
 @asynccontextmanager
 async def lifespan(app):
     """Manage startup and shutdown lifecycle."""
     logger.info("Frontend starting up...")
+    # Pages must never silently load htmx/Pico from a CDN
+    assets.check_vendored()
     try:
         health = await backend.health_check()
         logger.info(f"Backend connected: {health.get('status', 'unknown')}")
@@ -47,36 +153,36 @@ async def lifespan(app):
     try:
         settings = await backend.get_settings()
         lang = settings.get("language", "en")
-        set_language(lang)
+        set_default_language(lang)
         logger.info(f"Language set to: {lang}")
     except Exception as e:
         logger.warning(f"Could not load language setting, using default: {e}")
 
+    stop_watching = asyncio.Event()
+    watcher = None
+    if I18N_HOT_RELOAD:
+        watcher = asyncio.create_task(watch_strings(stop_watching))
+        logger.info("Watching language files for changes")
+
     yield
     logger.info("Frontend shutting down...")
+    if watcher is not None:
+        stop_watching.set()
+        await watcher
     await backend.close()
     logger.info("Backend client closed")
 
 
 # Initialize FastHTML app
 app = FastHTML(title="FridAI", lifespan=lifespan)
-
-
-# ── Helper to build lookup maps ──────────────────────────────────────
-
-async def _build_lookup_maps():
-    """Fetch categories and tags, return (cat_map, tag_map) dicts."""
-    try:
-        categories = await backend.get_categories()
-    except Exception:
-        categories = []
-    try:
-        tags = await backend.get_tags()
-    except Exception:
-        tags = []
-    cat_map = {c['id']: c['name'] for c in categories}
-    tag_map = {tg['id']: tg['name'] for tg in tags}
-    return cat_map, tag_map
+app.add_middleware(DeadlineMiddleware, default=REQUEST_DEADLINE_SECONDS)
+app.add_middleware(LanguageMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MIN_SIZE,
+    levels=COMPRESSION_LEVELS,
+    cpu_budget=COMPRESSION_CPU_BUDGET,
+)
 
 
 # ── Health endpoints ─────────────────────────────────────────────────
@@ -109,11 +215,31 @@ async def frontend_healthz():
             "status": "down",
             "error": str(e),
         }
+    result["checks"]["backend"]["circuit"] = backend.circuit_state()
 
     status_code = 200 if result["status"] == "healthy" else 503
     return JSONResponse(result, status_code=status_code)
 
 
+@app.get("/metrics")                                    # type: ignore
+async def frontend_metrics():
+    """Client-side counters (request coalescing, caches, i18n) as JSON."""
+    i18n = telemetry()
+    return JSONResponse({
+        "backend": backend.stats(),
+        "fragments": {"task_card": task_card_cache.stats()},
+        "i18n": i18n.stats() if i18n else {"enabled": False},
+    })
+
+
+# ── Static assets ────────────────────────────────────────────────────
+
+@app.get("/static/{filename:path}")                     # type: ignore
+async def static_asset(request: Request, filename: str):
+    """Serve fingerprinted CSS/JS with immutable caching."""
+    return assets.response(request, filename)
+
+
 # ── Root redirect ────────────────────────────────────────────────────
 
 @app.get("/")                                           # type: ignore
@@ -132,9 +258,9 @@ def home():
 
 
 @app.get("/app/tasks")                                  # type: ignore
-def tasks():
+async def tasks():
     try:
-        return tasks_page(backend)
+        return await tasks_page(backend, ssr_budget=_ssr_budget())
     except Exception as e:
         return shell(error_message(t("errors.page_load_failed", error=str(e))))
 
@@ -145,17 +271,17 @@ async def create_task(request: Request):
 
 
 @app.get("/app/all")                                    # type: ignore
-def all_tasks():
+async def all_tasks():
     try:
-        return all_tasks_page(backend)
+        return await all_tasks_page(backend, ssr_budget=_ssr_budget())
     except Exception as e:
         return shell(error_message(t("errors.page_load_failed", error=str(e))))
 
 
 @app.get("/app/categories")                             # type: ignore
-def categories():
+async def categories():
     try:
-        return categories_page(backend)
+        return await categories_page(backend, ssr_budget=_ssr_budget())
     except Exception as e:
         return shell(error_message(t("errors.page_load_failed", error=str(e))))
 
@@ -169,9 +295,13 @@ def tags():
 
 
 @app.get("/app/next")                                   # type: ignore
-def next48h():
+async def next48h():
     try:
-        return next_page(backend)
+        return await next_page(
+            backend,
+            ssr_budget=_ssr_budget(),
+            stream_budget=_stream_budget(),
+        )
     except Exception as e:
         return shell(error_message(t("errors.page_load_failed", error=str(e))))
 
@@ -187,11 +317,26 @@ def notifications():
 @app.get("/app/settings")                               # type: ignore
 def settings():
     try:
-        return settings_page(backend)
+        return settings_page(
+            backend,
+            stream_budget=_stream_budget(),
+            info_timeout=SYSTEM_INFO_BUDGET_SECONDS,
+            info_call_timeout=SYSTEM_INFO_CALL_TIMEOUT_SECONDS,
+        )
     except Exception as e:
         return shell(error_message(t("errors.page_load_failed", error=str(e))))
 
 
+def _ssr_budget() -> float:
+    """Seconds a page may wait for its initial data (0 = lazy loading)."""
+    return SSR_BUDGET_SECONDS if SSR_FIRST_PAINT else 0.0
+
+
+def _stream_budget() -> float:
+    """Seconds a streamed page keeps waiting on sections (0 = no streaming)."""
+    return STREAM_BUDGET_SECONDS if STREAM_PAGES else 0.0
+
+
 # ── HTMX handler routes (return HTML fragments) ─────────────────────
 
 @app.post("/app/categories/create")                     # type: ignore
@@ -207,13 +352,14 @@ async def create_tag_handler(request: Request):
 
 
 @app.get("/app/tags/cloud")                             # type: ignore
-async def tag_cloud_handler():
+async def tag_cloud_handler(request: Request):
     from app.pages.tags import render_tag_cloud
     try:
         tags = await backend.get_tags()
-        return render_tag_cloud(tags)
+        fragment = render_tag_cloud(tags)
     except Exception as e:
-        return error_message(t("errors.loading_tag_cloud", error=str(e)))
+        fragment = error_message(t("errors.loading_tag_cloud", error=str(e)))
+    return conditional_fragment(request, fragment)
 
 
 @app.get("/app/next/overdue")                           # type: ignore
@@ -235,9 +381,9 @@ async def test_ntfy_handler():
 
 
 @app.get("/app/notifications/status")                   # type: ignore
-async def notification_status_handler():
+async def notification_status_handler(request: Request):
     from app.pages.notifications import render_system_status
-    return await render_system_status(backend)
+    return conditional_fragment(request, await render_system_status(backend))
 
 
 @app.put("/app/notifications/settings")                 # type: ignore
@@ -261,7 +407,11 @@ async def template_settings_handler(request: Request, template_type: str):
 @app.get("/app/settings/system-info")                   # type: ignore
 async def system_info_handler():
     from app.pages.settings import render_system_info
-    return await render_system_info(backend)
+    return await render_system_info(
+        backend,
+        timeout=clamp(SYSTEM_INFO_BUDGET_SECONDS),
+        call_timeout=clamp(SYSTEM_INFO_CALL_TIMEOUT_SECONDS),
+    )
 
 
 @app.post("/app/settings/reset")                        # type: ignore
@@ -271,30 +421,51 @@ async def reset_settings_handler():
 
 
 @app.get("/app/stats")                                  # type: ignore
-async def quick_stats_handler():
-    """Aggregate quick stats from backend views API."""
-    try:
-        status_summary = await backend.get_views_summary('status-summary')
-        cats_summary = await backend.get_views_summary('categories-summary')
-        tags_summary = await backend.get_views_summary('tags-summary')
+async def quick_stats_handler(request: Request):
+    """Quick stats fragment, revalidated with an ETag."""
+    return conditional_fragment(request, await _render_quick_stats())
+
 
-        pending = sum(s['count'] for s in status_summary if s['key'] == 'pending')
-        completed = sum(s['count'] for s in status_summary if s['key'] == 'completed')
-        total_cats = len(cats_summary)
-        total_tags = len(tags_summary)
+async def _render_quick_stats():
+    """Aggregate quick stats from backend views API.
+
+    The three summaries are fetched concurrently under one shared deadline;
+    a summary that fails or misses it renders as a placeholder on its own.
+    """
+    try:
+        results = await gather_within(
+            {
+                'status': backend.get_views_summary('status-summary'),
+                'categories': backend.get_views_summary('categories-summary'),
+                'tags': backend.get_views_summary('tags-summary'),
+            },
+            timeout=clamp(STATS_TIMEOUT_SECONDS),
+        )
+        if all(isinstance(r, Exception) for r in results.values()):
+            raise results['status']
+
+        status_summary = results['status']
+        if isinstance(status_summary, Exception):
+            tasks_value = _stats_placeholder()
+        else:
+            pending = sum(s['count'] for s in status_summary if s['key'] == 'pending')
+            completed = sum(s['count'] for s in status_summary if s['key'] == 'completed')
+            tasks_value = ft.Span(
+                t("stats.tasks_value", pending=pending, completed=completed)
+            )
 
         return ft.Div(
             ft.Div(
                 ft.Strong(t("stats.tasks_label")),
-                ft.Span(t("stats.tasks_value", pending=pending, completed=completed)),
+                tasks_value,
             ),
             ft.Div(
                 ft.Strong(t("stats.categories_label")),
-                ft.Span(str(total_cats)),
+                _summary_count(results['categories']),
             ),
             ft.Div(
                 ft.Strong(t("stats.tags_label")),
-                ft.Span(str(total_tags)),
+                _summary_count(results['tags']),
             ),
             style="display: grid; gap: 0.5rem;"
         )
@@ -302,6 +473,18 @@ async def quick_stats_handler():
         return error_message(t("errors.loading_stats", error=str(e)))
 
 
+def _stats_placeholder():
+    """Placeholder for a quick-stats section whose summary is unavailable."""
+    return ft.Span(t("stats.unavailable"), style="color: var(--muted-color);")
+
+
+def _summary_count(summary):
+    """Render the length of a views summary, or a placeholder on failure."""
+    if isinstance(summary, Exception):
+        return _stats_placeholder()
+    return ft.Span(str(len(summary)))
+
+
 @app.get("/app/all/tasks")                              # type: ignore
 async def filtered_tasks(
     status: Optional[str] = None,
@@ -323,20 +506,7 @@ async def get_tasks(
     limit: Optional[int] = None,
 ):
     """Proxy to backend for tasks list"""
-    try:
-        tasks = await backend.get_tasks(status=status)
-        if limit:
-            tasks = tasks[:limit]
-        cat_map, tag_map = await _build_lookup_maps()
-        from app.utils.components import task_card
-        if not tasks:
-            return ft.Div(ft.P(t("empty_states.no_tasks")))
-        task_elements = [task_card(task, cat_map, tag_map) for task in tasks]
-        return ft.Div(*task_elements)
-    except BackendUnavailableError:
-        return error_message(t("errors.backend_unreachable"))
-    except Exception as e:
-        return error_message(t("errors.loading_tasks", error=str(e)))
+    return await render_task_list(backend, status=status, limit=limit)
 
 
 @app.get("/api/tasks/next")                             # type: ignore
@@ -352,19 +522,9 @@ async def get_next_tasks(hours: int = 48):
 
 
 @app.get("/api/categories")                             # type: ignore
-async def get_categories():
+async def get_categories(request: Request):
     """Proxy to backend for categories list"""
-    try:
-        categories = await backend.get_categories()
-        from app.pages.categories import render_category_card
-        if not categories:
-            return ft.Div(ft.P(t("empty_states.no_categories")))
-        category_elements = [render_category_card(cat) for cat in categories]
-        return ft.Div(*category_elements)
-    except BackendUnavailableError:
-        return error_message(t("errors.backend_unreachable"))
-    except Exception as e:
-        return error_message(t("errors.loading_categories", error=str(e)))
+    return conditional_fragment(request, await render_categories_list(backend))
 
 
 @app.get("/api/tags")                                   # type: ignore
@@ -412,7 +572,7 @@ async def complete_task(task_id: str):
     """Proxy to backend for task completion"""
     try:
         updated_task = await backend.complete_task(task_id)
-        cat_map, tag_map = await _build_lookup_maps()
+        cat_map, tag_map = await build_lookup_maps(backend)
         from app.utils.components import task_card
         return task_card(updated_task, cat_map, tag_map)
     except BackendUnavailableError:
@@ -1,3 +1,15 @@
 """FridAI frontend text/i18n package."""
 
-from app.i18n.loader import t, set_language, get_language, available_languages  # noqa: F401
+from app.i18n.loader import (  # noqa: F401
+    LANG_COOKIE,
+    LanguageMiddleware,
+    available_languages,
+    enable_telemetry,
+    get_language,
+    on_reload,
+    reload,
+    set_default_language,
+    set_language,
+    t,
+    telemetry,
+)
@@ -1,63 +1,425 @@
 """Minimal i18n loader. One YAML file per language."""
 
+import hashlib
+import logging
+import marshal
+import os
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 
-import yaml
+logger = logging.getLogger("fridai.frontend.i18n")
 
-_STRINGS: dict[str, Any] = {}
-_LANG: str = "en"
 _DIR = Path(__file__).parent
+# Parsed YAML, marshalled per interpreter (marshal's format is not stable).
+# Bump _CACHE_FORMAT whenever the cached structure changes.
+_CACHE_FORMAT = 1
+_CACHE_PATH = _DIR / "__pycache__" / f"strings.{sys.implementation.cache_tag}.marshal"
+CACHE_ENABLED = os.getenv("I18N_CACHE", "true").lower() in ("1", "true", "yes")
+FALLBACK = "en"
+LANG_COOKIE = "lang"
+# Called after every (re)load so caches of rendered text can be dropped
+_RELOAD_HOOKS: list[Callable[[], None]] = []
+
+
+def on_reload(hook: Callable[[], None]) -> Callable[[], None]:
+    """Register ``hook`` to run whenever the language files are reloaded."""
+    _RELOAD_HOOKS.append(hook)
+    return hook
+
+
+class _Entry:
+    """A compiled string: its raw text and, if it has fields, a template.
+
+    ``parts`` alternates literal text (even positions) with field names (odd
+    positions) for templates made only of plain ``{name}`` fields. Anything
+    fancier (format specs, conversions, attribute or index access,
+    positional fields) leaves ``parts`` as None and defers to str.format.
+    """
+
+    __slots__ = ("raw", "templated", "parts")
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.templated = "{" in raw or "}" in raw
+        self.parts: Optional[tuple] = None
+        if self.templated:
+            self.parts = _parse(raw)
+
+    def format(self, kwargs: dict[str, Any]) -> str:
+        if self.parts is None:
+            return self.raw.format(**kwargs)
+        parts = self.parts
+        out = [parts[0]]
+        for i in range(1, len(parts), 2):
+            out.append(str(kwargs[parts[i]]))
+            out.append(parts[i + 1])
+        return "".join(out)
+
+
+def _parse(raw: str) -> Optional[tuple]:
+    parts: list[str] = [""]
+    try:
+        parsed = list(Formatter().parse(raw))
+    except ValueError:
+        return None  # malformed; str.format raises the same way
+    for literal, field, spec, conversion in parsed:
+        parts[-1] += literal
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return None
+        parts.extend((field, ""))
+    return tuple(parts)
+
+
+def _compile(strings: dict[str, Any]) -> dict[str, _Entry]:
+    """Flatten nested strings into a dotted-key -> entry table."""
+    table: dict[str, _Entry] = {}
+
+    def walk(node: dict[str, Any], prefix: str) -> None:
+        for k, v in node.items():
+            path = f"{prefix}{k}"
+            if isinstance(v, dict):
+                walk(v, f"{path}.")
+            elif v is not None:
+                table[path] = _Entry(str(v))
+
+    walk(strings, "")
+    return table
+
+
+class Catalog:
+    """One language's strings, parsed and compiled. Never mutated."""
+
+    __slots__ = ("code", "name", "strings", "entries")
+
+    def __init__(self, code: str, strings: dict[str, Any]):
+        self.code = code
+        self.name = strings.get("meta", {}).get("display_name", code)
+        self.strings = strings
+        self.entries = _compile(strings)
+
+
+def _parse_yaml(data: bytes) -> dict[str, Any]:
+    import yaml  # only needed when the binary cache is stale
+
+    return yaml.safe_load(data) or {}
+
+
+def _read_cache() -> dict[str, Any]:
+    try:
+        cached = marshal.loads(_CACHE_PATH.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(cached, dict) or cached.get("format") != _CACHE_FORMAT:
+        return {}
+    return cached.get("files", {})
+
+
+def _write_cache(files: dict[str, Any]) -> None:
+    """Replace the cache file atomically; a read-only tree just skips it."""
+    data = marshal.dumps({"format": _CACHE_FORMAT, "files": files})
+    try:
+        _CACHE_PATH.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_CACHE_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, _CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write i18n cache {_CACHE_PATH}: {e}")
+
+
+def _load_strings(use_cache: bool) -> dict[str, dict[str, Any]]:
+    """Parsed strings per language code, from the cache where still valid.
+
+    A cached file is reused when its mtime and size match, or, failing
+    that, when its content hash does (e.g. after a fresh checkout).
+    """
+    cached = _read_cache() if use_cache else {}
+    files: dict[str, Any] = {}
+    for p in sorted(_DIR.glob("strings_*.yaml")):
+        code = p.stem.removeprefix("strings_")
+        st = p.stat()
+        entry = cached.get(p.name)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            files[p.name] = entry
+            continue
+        data = p.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        strings = entry["strings"] if entry and entry["sha256"] == digest else _parse_yaml(data)
+        files[p.name] = {
+            "code": code,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": digest,
+            "strings": strings,
+        }
+    if use_cache and files != cached:
+        _write_cache(files)
+    return {f["code"]: f["strings"] for f in files.values()}
+
+
+def _load_catalogs(
+    use_cache: bool = CACHE_ENABLED,
+    previous: Mapping[str, Catalog] = MappingProxyType({}),
+) -> Mapping[str, Catalog]:
+    """Build a registry, reusing ``previous`` catalogs whose strings match."""
+    catalogs = {}
+    for code, strings in _load_strings(use_cache).items():
+        old = previous.get(code)
+        if old is not None and old.strings == strings:
+            catalogs[code] = old
+        else:
+            catalogs[code] = Catalog(code, strings)
+    return MappingProxyType(catalogs)
+
+
+# Every installed language, loaded once; replaced wholesale by reload()
+_REGISTRY: Mapping[str, Catalog] = _load_catalogs()
+# English strings, kept under their historical name for callers and tests
+_STRINGS: dict[str, Any] = _REGISTRY[FALLBACK].strings
+# Language for requests that do not choose one (the saved backend setting)
+_DEFAULT: Catalog = _REGISTRY[FALLBACK]
+# Language of the current request, set by LanguageMiddleware
+_CURRENT: ContextVar[Optional[Catalog]] = ContextVar("language", default=None)
+
+
+def _catalog() -> Catalog:
+    return _CURRENT.get() or _DEFAULT
+
+
+def resolve(lang: Optional[str]) -> Optional[str]:
+    """Return the installed code for ``lang`` (``es-CL`` -> ``es``), or None."""
+    if not lang:
+        return None
+    lang = lang.strip().lower().replace("_", "-")
+    if lang in _REGISTRY:
+        return lang
+    primary = lang.split("-")[0]
+    return primary if primary in _REGISTRY else None
 
 
 def set_language(lang: str) -> None:
-    """Load strings for the given language code. Falls back to English."""
-    global _STRINGS, _LANG
-    path = _DIR / f"strings_{lang}.yaml"
-    if not path.exists():
-        path = _DIR / "strings_en.yaml"
-        lang = "en"
-    with open(path, encoding="utf-8") as f:
-        _STRINGS = yaml.safe_load(f) or {}
-    _LANG = lang
+    """Make ``lang`` the current request's language.
+
+    Falls back to English for unknown codes. Only the current context
+    changes (LanguageMiddleware scopes it to one request), and catalogs
+    are preloaded, so this is safe to call from request handlers.
+    """
+    _CURRENT.set(_REGISTRY[resolve(lang) or FALLBACK])
+
+
+def set_default_language(lang: str) -> None:
+    """Set the process-wide language for requests that do not pick one.
+
+    Meant for startup (the saved backend setting), not request handlers:
+    every client without a cookie or Accept-Language match sees it.
+    """
+    global _DEFAULT
+    _DEFAULT = _REGISTRY[resolve(lang) or FALLBACK]
 
 
 def get_language() -> str:
     """Return the currently active language code."""
-    return _LANG
+    return _catalog().code
 
 
 def available_languages() -> list[tuple[str, str]]:
     """Return list of (code, display_name) for all installed language files."""
-    langs = []
-    for p in sorted(_DIR.glob("strings_*.yaml")):
-        code = p.stem.removeprefix("strings_")
-        with open(p, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        name = data.get("meta", {}).get("display_name", code)
-        langs.append((code, name))
-    return langs
+    return [(c.code, c.name) for c in _REGISTRY.values()]
+
+
+def build_registry() -> Mapping[str, Catalog]:
+    """Re-read the language files; only changed ones are parsed and compiled.
+
+    Blocking (file I/O, YAML); run it off the event loop and hand the
+    result to ``install``.
+    """
+    return _load_catalogs(previous=_REGISTRY)
+
+
+def install(registry: Mapping[str, Catalog]) -> list[str]:
+    """Swap in ``registry`` and return the codes whose catalog changed.
+
+    Requests already running keep the catalog they started with. The
+    on_reload hooks run only when something changed.
+    """
+    global _REGISTRY, _STRINGS, _DEFAULT
+    changed = sorted(
+        code for code in set(registry) | set(_REGISTRY)
+        if registry.get(code) is not _REGISTRY.get(code)
+    )
+    if not changed:
+        return changed
+    default = registry.get(_DEFAULT.code) or registry[FALLBACK]
+    _REGISTRY, _STRINGS, _DEFAULT = registry, registry[FALLBACK].strings, default
+    for hook in _RELOAD_HOOKS:
+        hook()
+    return changed
+
+
+def reload() -> None:
+    """Re-read the language files and swap the registry in one step."""
+    install(_load_catalogs())
+
+
+def negotiate(cookie: Optional[str], accept_language: str) -> Optional[str]:
+    """Pick a language from the ``lang`` cookie, then Accept-Language."""
+    chosen = resolve(cookie)
+    if chosen:
+        return chosen
+    ranked = []
+    for i, part in enumerate(accept_language.split(",")):
+        tag, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0 and tag.strip() != "*":
+            ranked.append((-q, i, tag))
+    for _, _, tag in sorted(ranked):
+        chosen = resolve(tag)
+        if chosen:
+            return chosen
+    return None
+
+
+class LanguageMiddleware:
+    """ASGI middleware that sets the request's language.
+
+    The ``lang`` cookie wins, then the best Accept-Language match. Requests
+    that match neither use the default set by ``set_language``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        cookie, accept = None, ""
+        for name, value in scope.get("headers", []):
+            name = name.lower()
+            if name == b"cookie":
+                for pair in value.decode("latin-1").split(";"):
+                    k, _, v = pair.strip().partition("=")
+                    if k == LANG_COOKIE:
+                        cookie = v
+            elif name == b"accept-language":
+                accept = value.decode("latin-1")
+        lang = negotiate(cookie, accept)
+        token = _CURRENT.set(_REGISTRY[lang] if lang else None)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _CURRENT.reset(token)
+
+
+class Telemetry:
+    """Counters for t(): lookups per key, misses and failed interpolations.
+
+    Misses and failures are counted per language, so a key that only
+    misses in ``es`` points at a gap in strings_es.yaml.
+    """
+
+    def __init__(self):
+        self.lookups: Counter[str] = Counter()
+        self.misses: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.failures: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def stats(self, top: int = 20) -> dict[str, Any]:
+        """Return the ``top`` hottest keys plus every miss and failure."""
+        return {
+            "enabled": True,
+            "lookups": sum(self.lookups.values()),
+            "distinct_keys": len(self.lookups),
+            "hot_keys": dict(self.lookups.most_common(top)),
+            "misses": {lang: dict(c) for lang, c in sorted(self.misses.items())},
+            "interpolation_failures": {
+                lang: dict(c) for lang, c in sorted(self.failures.items())
+            },
+        }
+
+
+# None unless enable_telemetry() was called; t() then skips all counting
+_TELEMETRY: Optional[Telemetry] = None
+
+
+def enable_telemetry() -> Telemetry:
+    """Start counting t() calls (idempotent) and return the counters."""
+    global _TELEMETRY
+    if _TELEMETRY is None:
+        _TELEMETRY = Telemetry()
+    return _TELEMETRY
+
+
+def disable_telemetry() -> None:
+    global _TELEMETRY
+    _TELEMETRY = None
+
+
+def telemetry() -> Optional[Telemetry]:
+    """Return the active counters, or None when telemetry is off."""
+    return _TELEMETRY
 
 
 def t(key: str, **kwargs: Any) -> str:
     """Dot-path lookup with .format() interpolation. Returns key on miss."""
-    parts = key.split(".")
-    node: Any = _STRINGS
-    for part in parts:
+    catalog = _CURRENT.get() or _DEFAULT
+    entry = catalog.entries.get(key)
+    if _TELEMETRY is not None:
+        _TELEMETRY.lookups[key] += 1
+    if entry is None:
+        return _lookup_uncompiled(catalog, key, kwargs)
+    if not kwargs or not entry.templated:
+        return entry.raw
+    try:
+        return entry.format(kwargs)
+    except (KeyError, IndexError):
+        if _TELEMETRY is not None:
+            _TELEMETRY.failures[catalog.code][key] += 1
+        return entry.raw
+
+
+def _lookup_uncompiled(
+    catalog: Catalog, key: str, kwargs: dict[str, Any]
+) -> str:
+    """Walk the nested strings for keys the flat table does not hold.
+
+    Only section keys (which render as their dict) land here besides
+    genuine misses; kept so t() behaves exactly as before compilation.
+    """
+    node: Any = catalog.strings
+    for part in key.split("."):
         if isinstance(node, dict):
             node = node.get(part)
         else:
-            return key
+            node = None
+            break
     if node is None:
+        if _TELEMETRY is not None:
+            _TELEMETRY.misses[catalog.code][key] += 1
         return key
     result = str(node)
     if kwargs:
         try:
             result = result.format(**kwargs)
         except (KeyError, IndexError):
-            pass
+            if _TELEMETRY is not None:
+                _TELEMETRY.failures[catalog.code][key] += 1
     return result
-
-
-# Load default language at import time
-set_language("en")
@@ -0,0 +1,44 @@
+"""Hot reload of the language files while the app is running."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Optional
+
+from app.i18n import loader
+
+try:
+    from watchfiles import awatch
+except ImportError:  # optional: pip install "frontend[reload]"
+    awatch = None
+
+logger = logging.getLogger("fridai.frontend.i18n")
+
+
+def _is_strings_file(change, path: str) -> bool:
+    name = Path(path).name
+    return name.startswith("strings_") and name.endswith(".yaml")
+
+
+async def watch_strings(stop_event: Optional[asyncio.Event] = None) -> None:
+    """Recompile changed ``strings_*.yaml`` files until ``stop_event`` is set.
+
+    Parsing happens in a worker thread; the finished registry is swapped in
+    on the event loop, so requests never wait on file I/O. A file that
+    fails to parse leaves the previous catalogs in place.
+    """
+    if awatch is None:
+        logger.warning("watchfiles is not installed; i18n hot reload is off")
+        return
+    async for changes in awatch(
+        loader._DIR, watch_filter=_is_strings_file, stop_event=stop_event
+    ):
+        names = sorted({Path(path).name for _, path in changes})
+        try:
+            registry = await asyncio.to_thread(loader.build_registry)
+            changed = loader.install(registry)
+        except Exception as e:
+            logger.warning(f"Keeping current strings, reload of {names} failed: {e}")
+            continue
+        if changed:
+            logger.info(f"Reloaded strings for: {', '.join(changed)}")
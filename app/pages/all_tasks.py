@@ -3,12 +3,20 @@
 from fasthtml.common import *
 
 from app.i18n import t
-from app.utils.components import shell, task_card, error_message
-from app.utils.backend import BackendClient
+from app.utils.components import shell, cached_task_card, error_message
+from app.utils.backend import BackendClient, build_lookup_maps
+from app.utils.concurrency import prefetch
 
 
-def all_tasks_page(backend: BackendClient):
-    """Display all tasks with filtering and sorting options"""
+async def all_tasks_page(backend: BackendClient, ssr_budget: float = 0.0):
+    """Display all tasks with filtering and sorting options.
+
+    With a positive ``ssr_budget`` the default (unfiltered) list is
+    rendered inline when the backend answers in time.
+    """
+    prefetched = await prefetch(
+        {"tasks": lambda: render_tasks_list(backend, strict=True)}, ssr_budget
+    )
     # Filter controls
     filters = Div(
         H3(t("all_tasks.filters_title")),
@@ -46,7 +54,7 @@ def all_tasks_page(backend: BackendClient):
         H2(t("all_tasks.title")),
         filters,
         Div(
-            Div(
+            prefetched["tasks"] if "tasks" in prefetched else Div(
                 t("all_tasks.loading_all"),
                 **{                                     # type: ignore
                     "hx-get": "/app/all/tasks",
@@ -65,8 +73,12 @@ async def render_tasks_list(
     backend: BackendClient,
     status: str = "all",
     sort: str = "due_at",
+    strict: bool = False,
 ):
-    """Render filtered and sorted tasks list as an HTML fragment."""
+    """Render filtered and sorted tasks list as an HTML fragment.
+
+    With ``strict`` errors propagate instead of becoming an error message.
+    """
     try:
         # Map frontend filter to backend param
         backend_status = None
@@ -76,24 +88,23 @@ async def render_tasks_list(
         tasks = await backend.get_tasks(status=backend_status)
 
         # Build lookup maps
-        categories = await backend.get_categories()
-        tags = await backend.get_tags()
-        cat_map = {c['id']: c['name'] for c in categories}
-        tag_map = {tg['id']: tg['name'] for tg in tags}
+        cat_map, tag_map = await build_lookup_maps(backend)
 
-        # Client-side sort
+        # Client-side sort (copy: the backend result may be shared)
         if sort == "title":
-            tasks.sort(key=lambda tk: tk.get("title", "").lower())
+            tasks = sorted(tasks, key=lambda tk: tk.get("title", "").lower())
         else:  # default: due_at
-            tasks.sort(key=lambda tk: tk.get("due_at") or "9999-12-31")
+            tasks = sorted(tasks, key=lambda tk: tk.get("due_at") or "9999-12-31")
 
         if not tasks:
             return Div(P(t("empty_states.no_tasks_filtered")))
 
-        task_elements = [task_card(task, cat_map, tag_map) for task in tasks]
+        task_elements = [cached_task_card(task, cat_map, tag_map) for task in tasks]
         return Div(
             P(t("all_tasks.showing_count", count=len(tasks))),
             *task_elements
         )
     except Exception as e:
+        if strict:
+            raise
         return error_message(t("errors.loading_tasks", error=str(e)))
@@ -4,11 +4,20 @@ from fasthtml.common import *
 
 from app.i18n import t
 from app.utils.components import shell, form_field, error_message, success_message
-from app.utils.backend import BackendClient
+from app.utils.backend import BackendClient, BackendUnavailableError
+from app.utils.concurrency import prefetch
 
 
-def categories_page(backend: BackendClient):
-    """Categories management page"""
+async def categories_page(backend: BackendClient, ssr_budget: float = 0.0):
+    """Categories management page.
+
+    With a positive ``ssr_budget`` the existing categories are rendered
+    inline when the backend answers in time.
+    """
+    prefetched = await prefetch(
+        {"categories": lambda: render_categories_list(backend, strict=True)},
+        ssr_budget,
+    )
     # Category creation form
     form = Div(
         H3(t("categories.add_new")),
@@ -34,11 +43,13 @@ def categories_page(backend: BackendClient):
         Hr(),
         H3(t("categories.existing")),
         Div(
-            t("categories.loading"),
+            prefetched.get("categories", t("categories.loading")),
             id="categories-list",
             **{                                     # type: ignore
                 "hx-get": "/api/categories",
-                "hx-trigger": "load, refresh",
+                "hx-trigger": (
+                    "refresh" if "categories" in prefetched else "load, refresh"
+                ),
                 "hx-swap": "innerHTML",
             }
         ),
@@ -71,6 +82,26 @@ async def handle_category_creation(request, backend: BackendClient):
         return error_message(t("errors.create_category_failed", error=str(e)))
 
 
+async def render_categories_list(backend: BackendClient, strict: bool = False):
+    """Render all categories as cards (HTML fragment).
+
+    With ``strict`` errors propagate instead of becoming an error message.
+    """
+    try:
+        categories = await backend.get_categories()
+        if not categories:
+            return Div(P(t("empty_states.no_categories")))
+        return Div(*[render_category_card(cat) for cat in categories])
+    except BackendUnavailableError:
+        if strict:
+            raise
+        return error_message(t("errors.backend_unreachable"))
+    except Exception as e:
+        if strict:
+            raise
+        return error_message(t("errors.loading_categories", error=str(e)))
+
+
 def render_category_card(category):
     """Render a category as a card"""
     return Div(
@@ -4,12 +4,42 @@ from datetime import datetime
 from fasthtml.common import *
 
 from app.i18n import t
-from app.utils.components import shell, task_card
-from app.utils.backend import BackendClient
+from app.utils.components import shell, streaming_shell, cached_task_card
+from app.utils.backend import BackendClient, build_lookup_maps
+from app.utils.concurrency import prefetch
 
 
-def next_page(backend: BackendClient):
-    """Display tasks due in the next 48 hours"""
+def _lazy(placeholder, url: str, **attrs):
+    """Placeholder that fetches its content from ``url`` once loaded."""
+    return Div(
+        placeholder,
+        **attrs,
+        **{"hx-get": url, "hx-trigger": "load", "hx-swap": "innerHTML"},
+    )
+
+
+async def next_page(
+    backend: BackendClient,
+    ssr_budget: float = 0.0,
+    stream_budget: float = 0.0,
+):
+    """Display tasks due in the next 48 hours.
+
+    With a positive ``stream_budget`` the page skeleton is flushed at once
+    and the upcoming and overdue sections stream in as they resolve.
+    Otherwise a positive ``ssr_budget`` fetches both concurrently and
+    renders them inline when they arrive in time.
+    """
+    sections = {
+        "upcoming": lambda: render_upcoming_tasks(backend, 48),
+        "overdue": lambda: render_overdue_tasks(backend),
+    }
+    prefetched = {}
+    if stream_budget <= 0:
+        prefetched = await prefetch({
+            "upcoming": lambda: render_upcoming_tasks(backend, 48, strict=True),
+            "overdue": lambda: render_overdue_tasks(backend, strict=True),
+        }, ssr_budget)
     # Time period selector
     time_selector = Div(
         H3(t("next.time_period")),
@@ -37,32 +67,42 @@ def next_page(backend: BackendClient):
         time_selector,
         Hr(),
         H3(t("next.due_soon")),
-        Div(
+        Div(prefetched["upcoming"], id="upcoming-tasks")
+        if "upcoming" in prefetched
+        else _lazy(
             t("next.loading_upcoming"),
+            "/api/tasks/next?hours=48",
             id="upcoming-tasks",
-            **{                                                 # type: ignore
-                "hx-get": "/api/tasks/next?hours=48",
-                "hx-trigger": "load",
-                "hx-swap": "innerHTML",
-            },
         ),
         Hr(),
         H3(t("next.overdue_title")),
-        Div(
+        Div(prefetched["overdue"], id="overdue-tasks")
+        if "overdue" in prefetched
+        else _lazy(
             t("next.loading_overdue"),
+            "/app/next/overdue",
             id="overdue-tasks",
-            **{                                                 # type: ignore
-                "hx-get": "/app/next/overdue",
-                "hx-trigger": "load",
-                "hx-swap": "innerHTML",
-            },
         ),
     )
+    if stream_budget > 0:
+        return streaming_shell(
+            content,
+            {
+                "upcoming-tasks": sections["upcoming"],
+                "overdue-tasks": sections["overdue"],
+            },
+            stream_budget,
+        )
     return shell(content)
 
 
-async def render_upcoming_tasks(backend: BackendClient, hours: int = 48):
-    """Render tasks due within specified hours"""
+async def render_upcoming_tasks(
+    backend: BackendClient, hours: int = 48, strict: bool = False
+):
+    """Render tasks due within specified hours.
+
+    With ``strict`` errors propagate instead of becoming an error message.
+    """
     try:
         tasks = await backend.get_next_tasks(hours)
         if not tasks:
@@ -75,10 +115,7 @@ async def render_upcoming_tasks(backend: BackendClient, hours: int = 48):
             )
 
         # Build lookup maps
-        categories = await backend.get_categories()
-        tags = await backend.get_tags()
-        cat_map = {c['id']: c['name'] for c in categories}
-        tag_map = {tg['id']: tg['name'] for tg in tags}
+        cat_map, tag_map = await build_lookup_maps(backend)
 
         # Group tasks by time urgency
         now = datetime.now()
@@ -109,17 +146,17 @@ async def render_upcoming_tasks(backend: BackendClient, hours: int = 48):
         if urgent:
             sections.extend([
                 H4(t("next.due_very_soon"), style="color: var(--del-color);"),
-                *[task_card(task, cat_map, tag_map) for task in urgent]
+                *[cached_task_card(task, cat_map, tag_map) for task in urgent]
             ])
         if soon:
             sections.extend([
                 H4(t("next.due_today"), style="color: var(--mark-color);"),
-                *[task_card(task, cat_map, tag_map) for task in soon]
+                *[cached_task_card(task, cat_map, tag_map) for task in soon]
             ])
         if later:
             sections.extend([
                 H4(t("next.due_later"), style="color: var(--muted-color);"),
-                *[task_card(task, cat_map, tag_map) for task in later]
+                *[cached_task_card(task, cat_map, tag_map) for task in later]
             ])
 
         return Div(
@@ -127,12 +164,17 @@ async def render_upcoming_tasks(backend: BackendClient, hours: int = 48):
             *sections
         )
     except Exception as e:
+        if strict:
+            raise
         from app.utils.components import error_message
         return error_message(t("errors.loading_upcoming_tasks", error=str(e)))
 
 
-async def render_overdue_tasks(backend: BackendClient):
-    """Render overdue tasks using the dedicated backend endpoint"""
+async def render_overdue_tasks(backend: BackendClient, strict: bool = False):
+    """Render overdue tasks using the dedicated backend endpoint.
+
+    With ``strict`` errors propagate instead of becoming an error message.
+    """
     try:
         overdue_tasks = await backend.get_overdue_tasks()
 
@@ -140,10 +182,7 @@ async def render_overdue_tasks(backend: BackendClient):
             return P(t("empty_states.no_overdue"), style="color: var(--ins-color);")
 
         # Build lookup maps
-        categories = await backend.get_categories()
-        tags = await backend.get_tags()
-        cat_map = {c['id']: c['name'] for c in categories}
-        tag_map = {tg['id']: tg['name'] for tg in tags}
+        cat_map, tag_map = await build_lookup_maps(backend)
 
         now = datetime.now()
         task_elements = []
@@ -166,7 +205,7 @@ async def render_overdue_tasks(backend: BackendClient):
                         overdue_text,
                         style="color: var(--del-color); font-weight: bold; margin-bottom: 0.5rem;"
                     ),
-                    task_card(task, cat_map, tag_map)
+                    cached_task_card(task, cat_map, tag_map)
                 )
             )
 
@@ -178,5 +217,7 @@ async def render_overdue_tasks(backend: BackendClient):
             *task_elements
         )
     except Exception as e:
+        if strict:
+            raise
         from app.utils.components import error_message
         return error_message(t("errors.loading_overdue_tasks", error=str(e)))
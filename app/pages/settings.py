@@ -1,19 +1,32 @@
 # pages/settings.py
 
+import asyncio
+
 from fasthtml.common import *
 
-from app.i18n import t, available_languages, get_language, set_language
+from app.i18n import LANG_COOKIE, t, available_languages, get_language, set_language
 from app.utils.components import (
     shell,
+    streaming_shell,
     form_field,
     success_message,
     error_message,
 )
 from app.utils.backend import BackendClient
+from app.utils.concurrency import gather_within
+
 
+def settings_page(
+    backend: BackendClient,
+    stream_budget: float = 0.0,
+    info_timeout: float = 3.0,
+    info_call_timeout: float = 2.0,
+):
+    """Application settings and configuration page.
 
-def settings_page(backend: BackendClient):
-    """Application settings and configuration page"""
+    With a positive ``stream_budget`` the system information card streams
+    into the page instead of being fetched by a second request.
+    """
 
     # Build language options
     current_lang = get_language()
@@ -228,9 +241,24 @@ def settings_page(backend: BackendClient):
         )
     )
 
+    if stream_budget > 0:
+        return streaming_shell(
+            content,
+            {
+                "system-info": lambda: render_system_info(
+                    backend, info_timeout, info_call_timeout
+                ),
+            },
+            stream_budget,
+        )
     return shell(content)
 
 
+def _language_cookie():
+    """Remember the active language in this browser for a year."""
+    return cookie(LANG_COOKIE, get_language(), max_age=365 * 24 * 3600)
+
+
 async def handle_general_settings(request, backend: BackendClient):
     """Handle general settings form submission"""
     try:
@@ -241,9 +269,9 @@ async def handle_general_settings(request, backend: BackendClient):
             "language": new_lang,
         }
         await backend.update_settings(settings_data)
-        # Hot-reload the language for subsequent requests
+        # Applies to this response; the cookie carries it to later requests
         set_language(new_lang)
-        return success_message(t("settings.general_saved"))
+        return success_message(t("settings.general_saved")), _language_cookie()
     except Exception as e:
         return error_message(t("errors.save_settings_failed", error=str(e)))
 
@@ -269,53 +297,75 @@ async def handle_template_settings(
         return error_message(t("errors.save_template_failed", error=str(e)))
 
 
-async def render_system_info(backend: BackendClient):
-    """Render system information using backend health check and views"""
+async def render_system_info(
+    backend: BackendClient,
+    timeout: float = 3.0,
+    call_timeout: float = 2.0,
+):
+    """Render system information using backend health check and views.
+
+    All sources are fetched concurrently; ``call_timeout`` bounds each call
+    and ``timeout`` the whole gather. Cards whose source misses the budget
+    render as unknown instead of holding up the grid.
+    """
     try:
-        # Get backend health
-        try:
-            health = await backend.health_check()
-        except Exception:
-            health = {"status": "unreachable", "version": "unknown"}
-
-        # Get current settings
-        try:
-            settings = await backend.get_settings()
-        except Exception:
-            settings = {}
-
-        # Get stats from views
-        try:
-            status_summary = await backend.get_views_summary('status-summary')
+        results = await gather_within(
+            {
+                'health': backend.health_check(),
+                'settings': backend.get_settings(),
+                'status': backend.get_views_summary('status-summary'),
+                'categories': backend.get_views_summary('categories-summary'),
+                'tags': backend.get_views_summary('tags-summary'),
+            },
+            timeout=timeout,
+            per_call_timeout=call_timeout,
+        )
+        unknown = t("settings.info_unknown")
+
+        health = results['health']
+        if isinstance(health, asyncio.TimeoutError):
+            health = {"status": unknown, "version": unknown}
+        elif isinstance(health, Exception):
+            health = {"status": "unreachable", "version": unknown}
+
+        settings = results['settings']
+        if isinstance(settings, Exception):
+            notif_value, notif_color = unknown, "var(--muted-color)"
+            timezone = language = unknown
+        else:
+            notif_enabled = settings.get('notifications_enabled')
+            notif_value = (
+                t("notifications.enabled") if notif_enabled
+                else t("notifications.disabled")
+            )
+            notif_color = (
+                "var(--ins-color)" if notif_enabled else "var(--muted-color)"
+            )
+            timezone = settings.get('timezone', 'UTC')
+            language = settings.get('language', 'en')
+
+        status_summary = results['status']
+        if isinstance(status_summary, Exception):
+            pending = completed = total = unknown
+        else:
             pending = sum(s['count'] for s in status_summary if s['key'] == 'pending')
             completed = sum(s['count'] for s in status_summary if s['key'] == 'completed')
             total = pending + completed
-        except Exception:
-            pending = completed = total = 0
 
-        try:
-            categories = await backend.get_categories()
-            tags = await backend.get_tags()
-        except Exception:
-            categories = []
-            tags = []
+        def _count(summary):
+            return unknown if isinstance(summary, Exception) else len(summary)
 
-        notif_enabled = settings.get('notifications_enabled')
         info_cards = [
             (t("settings.info_backend_status"), health.get("status", "unknown"), "var(--ins-color)"),
             (t("settings.info_api_version"), health.get("version", "unknown"), "var(--primary)"),
             (t("settings.info_total_tasks"), str(total), "var(--primary)"),
             (t("settings.info_active_tasks"), str(pending), "var(--ins-color)"),
             (t("settings.info_completed"), str(completed), "var(--muted-color)"),
-            (t("settings.info_categories"), str(len(categories)), "var(--primary)"),
-            (t("settings.info_tags"), str(len(tags)), "var(--primary)"),
-            (
-                t("settings.info_notifications"),
-                t("notifications.enabled") if notif_enabled else t("notifications.disabled"),
-                "var(--ins-color)" if notif_enabled else "var(--muted-color)"
-            ),
-            (t("settings.info_timezone"), settings.get('timezone', 'UTC'), "var(--primary)"),
-            (t("settings.info_language"), settings.get('language', 'en'), "var(--primary)"),
+            (t("settings.info_categories"), str(_count(results['categories'])), "var(--primary)"),
+            (t("settings.info_tags"), str(_count(results['tags'])), "var(--primary)"),
+            (t("settings.info_notifications"), notif_value, notif_color),
+            (t("settings.info_timezone"), timezone, "var(--primary)"),
+            (t("settings.info_language"), language, "var(--primary)"),
         ]
 
         info_elements = []
@@ -356,6 +406,6 @@ async def reset_settings(backend: BackendClient):
         }
         await backend.update_settings(default_settings)
         set_language("en")
-        return success_message(t("settings.reset_success"))
+        return success_message(t("settings.reset_success")), _language_cookie()
     except Exception as e:
         return error_message(t("errors.reset_settings_failed", error=str(e)))
@@ -2,19 +2,38 @@
 
 from fastapi import Request
 from fasthtml.common import *
+from typing import Optional
 
 from app.i18n import t
 from app.utils.components import (
     shell,
     form_field,
+    cached_task_card,
     error_message,
     success_message,
 )
-from app.utils.backend import BackendClient
+from app.utils.backend import (
+    BackendClient,
+    BackendUnavailableError,
+    build_lookup_maps,
+)
+from app.utils.concurrency import prefetch
+
 
+async def tasks_page(backend: BackendClient, ssr_budget: float = 0.0):
+    """Tasks page with creation form and active tasks list.
 
-def tasks_page(backend: BackendClient):
-    """Tasks page with creation form and active tasks list"""
+    With a positive ``ssr_budget`` the active tasks are rendered inline if
+    the backend answers within that many seconds; otherwise they load lazily.
+    """
+    prefetched = await prefetch(
+        {
+            "active": lambda: render_task_list(
+                backend, status="pending", strict=True
+            ),
+        },
+        ssr_budget,
+    )
     # Task creation form
     form = Article(
         Header(H3(t("tasks.add_new_task"))),
@@ -99,13 +118,15 @@ def tasks_page(backend: BackendClient):
                 )
             ),
             Div(
-                t("tasks.loading_active"),
+                prefetched.get("active", t("tasks.loading_active")),
                 id="active-tasks",
                 **{
                     "hx-get": "/api/tasks?status=pending",
-                    "hx-trigger": "load, refresh",
+                    "hx-trigger": (
+                        "refresh" if "active" in prefetched else "load, refresh"
+                    ),
                     "hx-swap": "innerHTML",
-                    "aria-busy": "true"
+                    "aria-busy": "false" if "active" in prefetched else "true"
                 },
             ),
         ),
@@ -131,6 +152,37 @@ def tasks_page(backend: BackendClient):
     return shell(content)
 
 
+async def render_task_list(
+    backend: BackendClient,
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    strict: bool = False,
+):
+    """Render tasks as a list of cards (HTML fragment).
+
+    With ``strict`` errors propagate instead of becoming an error message,
+    so a failed prefetch falls back to lazy loading.
+    """
+    try:
+        # Push the limit down; the slice guards against backends ignoring it
+        tasks = await backend.get_tasks(status=status, limit=limit or None)
+        if limit:
+            tasks = tasks[:limit]
+        cat_map, tag_map = await build_lookup_maps(backend)
+        if not tasks:
+            return Div(P(t("empty_states.no_tasks")))
+        task_elements = [cached_task_card(task, cat_map, tag_map) for task in tasks]
+        return Div(*task_elements)
+    except BackendUnavailableError:
+        if strict:
+            raise
+        return error_message(t("errors.backend_unreachable"))
+    except Exception as e:
+        if strict:
+            raise
+        return error_message(t("errors.loading_tasks", error=str(e)))
+
+
 async def handle_task_form(request: Request, backend: BackendClient):
     """Handle task creation form submission"""
     try:
@@ -0,0 +1,23 @@
+// HTMX event handlers (loaded at the end of <body>)
+// The translated error text comes from <body data-htmx-error="...">.
+document.body.addEventListener('htmx:responseError', function(evt) {
+    console.error('HTMX Error:', evt.detail);
+    const errorMsg = document.createElement('div');
+    errorMsg.className = 'error-message';
+    errorMsg.textContent = document.body.dataset.htmxError;
+    errorMsg.style.position = 'fixed';
+    errorMsg.style.top = '20px';
+    errorMsg.style.right = '20px';
+    errorMsg.style.zIndex = '9999';
+    document.body.appendChild(errorMsg);
+    setTimeout(() => errorMsg.remove(), 5000);
+});
+
+document.body.addEventListener('htmx:afterSwap', function(evt) {
+    evt.detail.elt.removeAttribute('aria-busy');
+});
+
+// Preserve theme across HTMX navigations
+document.body.addEventListener('htmx:configRequest', function(evt) {
+    evt.detail.headers['X-Theme'] = getStoredTheme();
+});
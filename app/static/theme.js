@@ -0,0 +1,61 @@
+// Theme management (loaded in <head> so the theme applies before first paint)
+// Translated labels come from data-label-* attributes on #theme-toggle.
+function getStoredTheme() {
+    return localStorage.getItem('theme') || 'dark';
+}
+
+function setTheme(theme) {
+    if (theme === 'auto') {
+        // Remove data-theme to use system preference
+        document.documentElement.removeAttribute('data-theme');
+    } else {
+        document.documentElement.setAttribute('data-theme', theme);
+    }
+    localStorage.setItem('theme', theme);
+    updateThemeToggle(theme);
+}
+
+function updateThemeToggle(theme) {
+    const toggle = document.getElementById('theme-toggle');
+    if (toggle) {
+        if (theme === 'dark') {
+            toggle.textContent = '🌙';
+            toggle.setAttribute('aria-label', toggle.dataset.labelLight);
+        } else if (theme === 'light') {
+            toggle.textContent = '☀️';
+            toggle.setAttribute('aria-label', toggle.dataset.labelDark);
+        } else {
+            toggle.textContent = '🌓';
+            toggle.setAttribute('aria-label', toggle.dataset.labelManual);
+        }
+    }
+}
+
+function toggleTheme() {
+    const currentTheme = getStoredTheme();
+    let newTheme;
+
+    if (currentTheme === 'dark') {
+        newTheme = 'light';
+    } else if (currentTheme === 'light') {
+        newTheme = 'auto';
+    } else {
+        newTheme = 'dark';
+    }
+
+    setTheme(newTheme);
+}
+
+// Initialize theme on page load
+document.addEventListener('DOMContentLoaded', function() {
+    const storedTheme = getStoredTheme();
+    setTheme(storedTheme);
+});
+
+// Set initial theme immediately (before DOMContentLoaded)
+(function() {
+    const theme = getStoredTheme();
+    if (theme !== 'auto') {
+        document.documentElement.setAttribute('data-theme', theme);
+    }
+})();
@@ -1,7 +1,19 @@
 # utils/backend.py
 
+import asyncio
+import importlib.util
+import logging
+import time
+
 import httpx
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Set
+
+from app.utils import deadline
+from app.utils.cache import LRUCache, TTLCache
+from app.utils.concurrency import SingleFlight
+from app.utils.resilience import CircuitBreaker, LatencyTracker, RetryPolicy
+
+logger = logging.getLogger("fridai.frontend.backend")
 
 
 class BackendUnavailableError(Exception):
@@ -17,25 +29,335 @@ class BackendAPIError(Exception):
         super().__init__(f"HTTP {status_code}: {detail}")
 
 
+class CircuitOpenError(BackendUnavailableError):
+    """Raised without a network call while the circuit breaker is open."""
+    pass
+
+
+class DeadlineExceededError(BackendUnavailableError):
+    """Raised when the incoming request's deadline leaves no time to call."""
+    pass
+
+
+async def build_lookup_maps(backend: "BackendClient"):
+    """Fetch categories and tags concurrently, return (cat_map, tag_map).
+
+    A lookup that fails (or runs out of request deadline) yields an empty
+    map, so task cards still render with ``#id`` fallbacks.
+    """
+    categories, tags = await asyncio.gather(
+        backend.get_categories(), backend.get_tags(), return_exceptions=True
+    )
+    if isinstance(categories, BaseException):
+        categories = []
+    if isinstance(tags, BaseException):
+        tags = []
+    cat_map = {c['id']: c['name'] for c in categories}
+    tag_map = {tg['id']: tg['name'] for tg in tags}
+    return cat_map, tag_map
+
+
 class BackendClient:
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        reference_ttl: float = 0.0,
+        reference_stale_ttl: float = 0.0,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        http2: bool = False,
+        breaker_threshold: int = 0,
+        breaker_reset_timeout: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            base_url: Backend root URL.
+            reference_ttl: Seconds categories/tags are served from cache
+                (0 disables the cache).
+            reference_stale_ttl: Extra seconds an expired entry is still
+                served while it is refreshed in the background.
+            limits: Connection pool limits (httpx defaults when omitted).
+            timeout: Connect/read/write/pool timeouts (30 s each when
+                omitted).
+            http2: Multiplex requests over HTTP/2 when the optional ``h2``
+                package is installed; falls back to HTTP/1.1 otherwise.
+            breaker_threshold: Consecutive unreachable/5xx failures that
+                open the circuit (0 disables the breaker).
+            breaker_reset_timeout: Seconds the circuit stays open before a
+                single probe request is let through.
+            retry_policy: Backoff and budget for retrying idempotent calls
+                (no retries when omitted).
+            hedge: Send a second copy of slow hedgeable GETs once the first
+                has been outstanding longer than the observed p95 latency.
+            transport: Custom httpx transport (used by tests).
+        """
         self.base_url = base_url.rstrip('/')
-        self.client = httpx.AsyncClient(timeout=30.0)
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+            http2 = False
+        self.limits = limits or httpx.Limits()
+        self.timeout = timeout or httpx.Timeout(30.0)
+        self.http2 = http2
+        self.client = httpx.AsyncClient(
+            limits=self.limits, timeout=self.timeout, http2=http2,
+            transport=transport,
+        )
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.pool_timeouts = 0
+        self.reference_cache = TTLCache(reference_ttl, reference_stale_ttl)
+        self.single_flight = SingleFlight()
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset_timeout)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedge = hedge
+        self.latency = LatencyTracker()
+        self.hedged = 0
+        # (endpoint, params) -> (etag, last_modified, decoded body)
+        self.validators = LRUCache(max_entries=256)
+        self.not_modified = 0
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: Optional[bool] = None,
+        hedge: bool = False,
+        **kwargs,
+    ) -> Any:
+        """Make HTTP request to backend.
+
+        Identical concurrent GETs (same endpoint and params) are coalesced
+        into one upstream call whose decoded result is shared by every
+        waiter, so callers must treat returned objects as read-only.
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
-        """Make HTTP request to backend."""
+        Args:
+            idempotent: Whether the call may be retried (defaults to True
+                for GET only).
+            hedge: Allow a hedged second request for this GET.
+        """
+        if idempotent is None:
+            idempotent = method == 'GET'
+
+        def call():
+            return self._execute(method, endpoint, idempotent, hedge, **kwargs)
+
+        if method == 'GET' and set(kwargs) <= {'params'}:
+            params = kwargs.get('params') or {}
+            key = (method, endpoint, tuple(sorted(params.items())))
+            try:
+                return await self.single_flight.do(key, call)
+            except asyncio.TimeoutError as e:
+                # This caller's deadline ran out; the shared call goes on
+                # for the other waiters, or is cancelled if none are left
+                raise DeadlineExceededError("Request deadline exceeded") from e
+        return await call()
+
+    async def _execute(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool,
+        hedge: bool,
+        **kwargs,
+    ) -> Any:
+        """Run the call, retrying idempotent ones with jittered backoff.
+
+        An attempt cut off by a deadline that was extended meanwhile (a
+        later waiter joined the coalesced call) is sent again with the new
+        budget and does not count as a retry.
+        """
+        policy = self.retry_policy
+        policy.deposit()
+        attempts = policy.max_attempts if idempotent else 1
+        attempt = 0
+        while True:
+            attempt += 1
+            bound = deadline.current()
+            try:
+                if hedge and self.hedge and method == 'GET':
+                    return await self._hedged_send(method, endpoint, **kwargs)
+                return await self._guarded_send(method, endpoint, **kwargs)
+            except (BackendUnavailableError, BackendAPIError) as e:
+                if isinstance(e, DeadlineExceededError):
+                    if deadline.current() == bound:
+                        raise
+                    attempt -= 1
+                    continue
+                if (
+                    method == 'DELETE' and attempt > 1
+                    and isinstance(e, BackendAPIError) and e.status_code == 404
+                ):
+                    # An earlier attempt already deleted it
+                    return None
+                if (
+                    attempt >= attempts
+                    or not self._is_retryable(e)
+                    or not policy.try_spend()
+                ):
+                    raise
+                delay = policy.backoff(attempt)
+                left = deadline.remaining()
+                if left is not None and left <= delay:
+                    raise
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, (CircuitOpenError, DeadlineExceededError)):
+            return False
+        if isinstance(error, BackendAPIError):
+            return error.status_code in (502, 503, 504)
+        return isinstance(error, BackendUnavailableError)
+
+    async def _timed_send(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send and record the latency of a successful hedgeable GET.
+
+        Samples are kept per endpoint; only hedgeable endpoints are timed,
+        so health checks and per-id lookups never skew the hedge delay.
+        """
+        started = time.monotonic()
+        result = await self._guarded_send(method, endpoint, **kwargs)
+        self.latency.record(time.monotonic() - started, endpoint)
+        return result
+
+    async def _hedged_send(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send, and race a second copy if the first exceeds the p95 latency."""
+        delay = self.latency.percentile(0.95, endpoint)
+        if delay is None:
+            return await self._timed_send(method, endpoint, **kwargs)
+        first = asyncio.ensure_future(self._timed_send(method, endpoint, **kwargs))
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return first.result()
+            if self.retry_policy.try_spend():
+                self.hedged += 1
+                pending.add(asyncio.ensure_future(
+                    self._timed_send(method, endpoint, **kwargs)
+                ))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _guarded_send(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send through the circuit breaker.
+
+        Unreachable-backend errors and 5xx responses count as failures;
+        anything else the backend answered counts as success. Running out
+        of request deadline says nothing about the backend and is ignored.
+        While the circuit is open this raises CircuitOpenError without
+        touching the network.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Backend at {self.base_url} is unavailable (circuit open)"
+            )
+        try:
+            result = await self._send(method, endpoint, **kwargs)
+        except BackendAPIError as e:
+            if e.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        except DeadlineExceededError:
+            self.breaker.release()
+            raise
+        except BackendUnavailableError:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Perform one HTTP round trip and map transport errors.
+
+        When the incoming request carries a deadline, every timeout phase
+        is clamped to the time left and the whole call is cut off there.
+
+        GET responses carrying an ETag or Last-Modified validator are
+        remembered with their decoded body; the next GET for the same
+        endpoint and params is sent conditionally and a 304 reuses the
+        stored object without re-downloading or re-parsing it.
+        """
         url = f"{self.base_url}{endpoint}"
+        validator_key = None
+        cached = None
+        if method == 'GET':
+            params = kwargs.get('params') or {}
+            validator_key = (endpoint, tuple(sorted(params.items())))
+            cached = self.validators.get(validator_key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                headers = dict(kwargs.get('headers') or {})
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+                kwargs['headers'] = headers
+        cutoff = deadline.current()
+        left = deadline.remaining()
+        if left is not None:
+            if left <= 0:
+                raise DeadlineExceededError("Request deadline exceeded")
+            t = self.timeout
+            kwargs['timeout'] = httpx.Timeout(
+                connect=min(t.connect or left, left),
+                read=min(t.read or left, left),
+                write=min(t.write or left, left),
+                pool=min(t.pool or left, left),
+            )
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
         try:
-            response = await self.client.request(method, url, **kwargs)
+            response = await asyncio.wait_for(
+                self.client.request(method, url, **kwargs), left
+            )
+            if response.status_code == 304 and cached is not None:
+                self.not_modified += 1
+                return cached[2]
             response.raise_for_status()
             if response.headers.get('content-type', '').startswith('application/json'):
-                return response.json()
-            return response.text
+                body = response.json()
+            else:
+                body = response.text
+            if validator_key is not None:
+                etag = response.headers.get('etag')
+                last_modified = response.headers.get('last-modified')
+                if etag or last_modified:
+                    self.validators.put(validator_key, (etag, last_modified, body))
+                elif cached is not None:
+                    self.validators.pop(validator_key)
+            return body
         except httpx.ConnectError as e:
             raise BackendUnavailableError(
                 f"Cannot connect to backend at {self.base_url}"
             ) from e
-        except httpx.TimeoutException as e:
+        except httpx.PoolTimeout as e:
+            self.pool_timeouts += 1
+            raise BackendUnavailableError(
+                "Backend connection pool exhausted"
+            ) from e
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+            if cutoff is not None and time.monotonic() >= cutoff - 0.001:
+                raise DeadlineExceededError("Request deadline exceeded") from e
             raise BackendUnavailableError("Backend request timed out") from e
         except httpx.HTTPStatusError as e:
             raise BackendAPIError(
@@ -43,6 +365,8 @@ class BackendClient:
             ) from e
         except httpx.RequestError as e:
             raise BackendUnavailableError(f"Request failed: {e}") from e
+        finally:
+            self.in_flight -= 1
 
     # ── Task operations ──────────────────────────────────────────────
 
@@ -53,6 +377,8 @@ class BackendClient:
         tag: Optional[int] = None,
         overdue_only: bool = False,
         category: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get tasks with optional filters.
 
@@ -62,6 +388,8 @@ class BackendClient:
             tag: filter by tag ID
             overdue_only: only return overdue tasks
             category: filter by category ID
+            limit: maximum number of tasks the backend should return
+            offset: number of matching tasks to skip
         """
         params: Dict[str, Any] = {}
         if status is not None:
@@ -74,7 +402,45 @@ class BackendClient:
             params['overdue_only'] = 'true'
         if category is not None:
             params['category'] = category
-        return await self._request('GET', '/api/tasks', params=params)
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return await self._request(
+            'GET', '/api/tasks', hedge=True, params=params
+        )
+
+    async def iter_task_pages(
+        self, page_size: int = 100, max_pages: int = 1000, **filters: Any
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield tasks page by page using limit/offset.
+
+        Accepts the same filters as get_tasks. Stops after the first page
+        shorter than ``page_size``, and guards against backends that ignore
+        limit/offset: a page longer than ``page_size`` is yielded as the
+        whole result, a page starting with an already-seen id ends the
+        walk, and no more than ``max_pages`` pages are fetched.
+        """
+        offset = 0
+        seen: Set[Any] = set()
+        for _ in range(max_pages):
+            page = await self.get_tasks(
+                limit=page_size, offset=offset, **filters
+            )
+            first = page[0].get('id') if page else None
+            if first is not None and first in seen:
+                logger.warning("Backend repeated a page of tasks; offset ignored?")
+                return
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            if len(page) > page_size:
+                logger.warning("Backend ignored the page size; got every task at once")
+                return
+            seen.update(task.get('id') for task in page)
+            offset += len(page)
+        logger.warning(f"Stopped paging tasks after {max_pages} pages")
 
     async def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new task."""
@@ -84,7 +450,7 @@ class BackendClient:
         """Delete a task. force=True allows deleting non-completed tasks."""
         params = {'force': 'true'} if force else {}
         return await self._request(
-            'DELETE', f'/api/tasks/{task_id}', params=params
+            'DELETE', f'/api/tasks/{task_id}', idempotent=force, params=params
         )
 
     async def complete_task(self, task_id: str) -> Dict[str, Any]:
@@ -94,46 +460,64 @@ class BackendClient:
     async def get_next_tasks(self, hours: int = 48) -> List[Dict[str, Any]]:
         """Get tasks due in the next N hours."""
         return await self._request(
-            'GET', '/api/tasks/next', params={'hours': hours}
+            'GET', '/api/tasks/next', hedge=True, params={'hours': hours}
         )
 
     async def get_overdue_tasks(self) -> List[Dict[str, Any]]:
         """Get overdue tasks via the dedicated endpoint."""
-        return await self._request('GET', '/api/tasks/overdue')
+        return await self._request('GET', '/api/tasks/overdue', hedge=True)
 
     # ── Category operations ──────────────────────────────────────────
 
     async def get_categories(self) -> List[Dict[str, Any]]:
-        """Get all categories."""
-        return await self._request('GET', '/api/categories')
+        """Get all categories (served from the reference cache)."""
+        return await self.reference_cache.get(
+            'categories', lambda: self._request('GET', '/api/categories')
+        )
 
     async def create_category(self, category_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new category."""
-        return await self._request(
-            'POST', '/api/categories', json=category_data
-        )
+        try:
+            return await self._request(
+                'POST', '/api/categories', json=category_data
+            )
+        finally:
+            self.reference_cache.invalidate('categories')
 
     async def delete_category(self, category_id: str) -> Any:
         """Delete a category."""
-        return await self._request(
-            'DELETE', f'/api/categories/{category_id}', params={'force': 'true'}
-        )
+        try:
+            return await self._request(
+                'DELETE', f'/api/categories/{category_id}',
+                idempotent=True, params={'force': 'true'},
+            )
+        finally:
+            self.reference_cache.invalidate('categories')
 
     # ── Tag operations ───────────────────────────────────────────────
 
     async def get_tags(self) -> List[Dict[str, Any]]:
-        """Get all tags."""
-        return await self._request('GET', '/api/tags')
+        """Get all tags (served from the reference cache)."""
+        return await self.reference_cache.get(
+            'tags', lambda: self._request('GET', '/api/tags')
+        )
 
     async def create_tag(self, tag_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new tag."""
-        return await self._request('POST', '/api/tags', json=tag_data)
+        try:
+            return await self._request('POST', '/api/tags', json=tag_data)
+        finally:
+            self.reference_cache.invalidate('tags')
 
     async def delete_tag(self, tag_id: str) -> Any:
         """Delete a tag."""
-        return await self._request(
-            'DELETE', f'/api/tags/{tag_id}', params={'force': 'true'}
-        )
+        try:
+            return await self._request(
+                'DELETE', f'/api/tags/{tag_id}',
+                idempotent=True, params={'force': 'true'},
+            )
+        finally:
+            self.reference_cache.invalidate('tags')
 
     # ── Notification operations ──────────────────────────────────────
 
@@ -205,6 +589,32 @@ class BackendClient:
         """Check backend health via /healthz."""
         return await self._request('GET', '/healthz')
 
+    def circuit_state(self) -> Dict[str, Any]:
+        """Return the circuit breaker snapshot."""
+        return self.breaker.snapshot()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return client-side counters for the metrics endpoint."""
+        return {
+            "pool": {
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "pool_timeouts": self.pool_timeouts,
+            },
+            "circuit": self.circuit_state(),
+            "retry": {**self.retry_policy.snapshot(), "hedged": self.hedged},
+            "single_flight": self.single_flight.stats(),
+            "reference_cache": self.reference_cache.stats(),
+            "conditional": {
+                **self.validators.stats(),
+                "not_modified": self.not_modified,
+            },
+        }
+
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
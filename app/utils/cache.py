@@ -0,0 +1,183 @@
+# utils/cache.py
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("fridai.frontend.cache")
+
+
+class TTLCache:
+    """Async TTL cache with stale-while-revalidate refresh.
+
+    Entries younger than ``ttl`` are served as-is. Entries older than that
+    but still within ``ttl + stale_ttl`` are served immediately while a
+    single background task reloads them. Anything older is reloaded inline.
+    A ``ttl`` of zero disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def get(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for ``key``, loading it if needed."""
+        if self.ttl <= 0:
+            return await loader()
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = self._clock() - stored_at
+            if age < self.ttl:
+                self.hits += 1
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._schedule_refresh(key, loader)
+                return value
+        self.misses += 1
+        return await self._load(key, loader)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` so the next read goes to the loader.
+
+        Loads already in flight for the key are not allowed to repopulate
+        the entry, so a write followed by a read never sees pre-write data.
+        """
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Invalidate every entry."""
+        for key in list(self._entries):
+            self.invalidate(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }
+
+    async def _load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        generation = self._generations.get(key, 0)
+        value = await loader()
+        if self._generations.get(key, 0) == generation:
+            self._entries[key] = (value, self._clock())
+        return value
+
+    def _schedule_refresh(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> None:
+        if key in self._refreshing:
+            return
+        # Detach from the triggering request's context (and its deadline)
+        task = asyncio.get_running_loop().create_task(
+            self._load(key, loader), context=contextvars.Context()
+        )
+        self._refreshing[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            self._refreshing.pop(key, None)
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(
+                    f"Background refresh of {key!r} failed: {t.exception()}"
+                )
+
+        task.add_done_callback(_done)
+
+
+class LRUCache:
+    """Bounded least-recently-used mapping with hit/miss counters.
+
+    Bounded by ``max_entries`` and, when ``sizeof`` is given, by the sum of
+    ``sizeof(value)`` staying under ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if key in self._entries:
+            self.pop(key)
+        size = self._sizeof(value) if self._sizeof else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self._entries[key] = value
+        self._bytes += size
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._sizeof(evicted) if self._sizeof else 0
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        value = self._entries.pop(key, None)
+        if value is not None and self._sizeof:
+            self._bytes -= self._sizeof(value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters for diagnostics."""
+        lookups = self.hits + self.misses
+        stats = {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+        if self._sizeof:
+            stats["bytes"] = self._bytes
+        return stats
@@ -1,10 +1,20 @@
 # utils/components.py
 
+import asyncio
+import hashlib
+import json
+import time
 from datetime import datetime
 from fasthtml import ft
-from typing import Dict, Any, Optional
+from fasthtml.common import NotStr, fh_cfg, to_xml
+from starlette.responses import HTMLResponse, Response, StreamingResponse
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
 
-from app.i18n import t
+from app.i18n import t, get_language, on_reload
+from app.utils.cache import LRUCache
+from app.utils.deadline import clamp
+from app.utils.serializer import fast_xml
+from app.utils.static import assets
 
 
 def nav():
@@ -78,13 +88,20 @@ def nav():
                         "class": "contrast",
                         "style": "padding: 0.5rem; min-width: auto;",
                         "onclick": "toggleTheme()",
-                        "aria-label": t("nav.theme_toggle_label")
+                        "aria-label": t("nav.theme_toggle_label"),
+                        # Labels read by static/theme.js
+                        "data-label-light": t("nav.switch_to_light"),
+                        "data-label-dark": t("nav.switch_to_dark"),
+                        "data-label-manual": t("nav.switch_to_manual"),
                     }
                 )
             )
         ),
         **{                                                             # type: ignore
             "class": "container-fluid",
+            # Boosted links swap only #content (see Shell.__response__)
+            "hx-boost": "true",
+            "hx-target": "#content",
             "style": """
                         display: flex;
                         align-items: center;
@@ -96,16 +113,15 @@ def nav():
     )
 
 
-def shell(content):
-    """Main page shell with navigation, PicoCSS, and dark mode support"""
-    htmx = ft.Script(src="https://unpkg.com/htmx.org@1.9.12")
-    pico = ft.Link(rel="stylesheet", href="https://cdn.jsdelivr.net/npm/@picocss/pico@2/css/pico.min.css")
+def _shell_tree(content):
+    """Full page tree: head, nav and ``content`` inside ``#content``.
 
-    # Pre-render JS strings from i18n
-    js_switch_to_light = t("nav.switch_to_light")
-    js_switch_to_dark = t("nav.switch_to_dark")
-    js_switch_to_manual = t("nav.switch_to_manual")
-    js_htmx_error = t("errors.htmx_error")
+    Styles and scripts live in fingerprinted static files (see
+    app/utils/static.py) so browsers cache them across navigations; the
+    only per-language strings they need travel in data attributes.
+    """
+    htmx = ft.Script(src=assets.vendor_url("vendor/htmx.min.js"))
+    pico = ft.Link(rel="stylesheet", href=assets.vendor_url("vendor/pico.min.css"))
 
     return ft.Html(
         ft.Head(
@@ -115,289 +131,223 @@ def shell(content):
                 name="viewport",
                 content="width=device-width, initial-scale=1"
             ),
+            ft.Link(rel="preload", href=assets.url("app.css"), **{"as": "style"}),
+            ft.Link(rel="preload", href=assets.url("htmx-events.js"), **{"as": "script"}),
             pico,
+            ft.Link(rel="stylesheet", href=assets.url("app.css")),
             htmx,
-            ft.Style(
-                """
-                /* Custom styles on top of PicoCSS */
-                :root {
-                    --spacing: 1rem;
-                }
+            ft.Script(src=assets.url("theme.js")),
+        ),
+        ft.Body(
+            nav(),
+            ft.Main(
+                ft.Div(content, id="content"),
+                **{"class": "container-fluid"}          # type: ignore
+            ),
+            ft.Script(src=assets.url("htmx-events.js")),
+            **{"data-htmx-error": t("errors.htmx_error")}           # type: ignore
+        ),
+        **{"data-theme": "dark"}  # Set dark as default         # type: ignore
+    )
 
-                /* Navigation styles */
-                nav ul {
-                    list-style: none;
-                    padding: 0;
-                    margin: 0;
-                    display: flex;
-                    gap: 1rem;
-                    align-items: center;
-                }
 
-                nav ul li {
-                    margin: 0;
-                }
+# Stands in for the page content while the shell is rendered once per language
+_CONTENT_MARKER = "<!--fridai:content-->"
+_shell_templates: Dict[str, Tuple[bytes, bytes]] = {}
 
-                nav ul li a {
-                    text-decoration: none;
-                    padding: 0.5rem 1rem;
-                    border-radius: var(--border-radius);
-                    transition: background-color 0.2s;
-                }
 
-                nav ul li a:hover {
-                    background-color: var(--secondary-hover);
-                }
+@on_reload
+def _clear_shell_templates() -> None:
+    _shell_templates.clear()
 
-                /* Task card styles */
-                .task-item {
-                    border: 1px solid var(--muted-border-color);
-                    padding: var(--spacing);
-                    margin: 0.5rem 0;
-                    border-radius: var(--border-radius);
-                    background-color: var(--card-background-color);
-                    transition: box-shadow 0.2s;
-                }
 
-                .task-item:hover {
-                    box-shadow: var(--card-box-shadow);
-                }
+def _shell_template() -> Tuple[bytes, bytes]:
+    """Return the (prefix, suffix) bytes surrounding ``#content``."""
+    lang = get_language()
+    template = _shell_templates.get(lang)
+    if template is None:
+        page = to_xml(_shell_tree(NotStr(_CONTENT_MARKER)), indent=fh_cfg.indent)
+        prefix, _, suffix = page.partition(_CONTENT_MARKER)
+        template = (prefix.encode(), suffix.encode())
+        _shell_templates[lang] = template
+    return template
 
-                .task-completed {
-                    opacity: 0.6;
-                }
 
-                .task-completed h4 {
-                    text-decoration: line-through;
-                }
-
-                .task-actions {
-                    margin-top: var(--spacing);
-                    display: flex;
-                    gap: 0.5rem;
-                }
-
-                .task-actions button {
-                    font-size: 0.875rem;
-                    padding: 0.25rem 0.75rem;
-                }
+def is_partial_request(req) -> bool:
+    """True for htmx navigations that only swap ``#content``.
 
-                /* Priority indicators */
-                .priority-high {
-                    border-left: 4px solid var(--del-color);
-                }
+    History restores (cache misses on back/forward) replace the whole body,
+    so they still get the full page.
+    """
+    headers = req.headers
+    return "hx-request" in headers and "hx-history-restore-request" not in headers
 
-                .priority-medium {
-                    border-left: 4px solid var(--mark-color);
-                }
 
-                .priority-low {
-                    border-left: 4px solid var(--ins-color);
-                }
+class Shell:
+    """Page content to be spliced into the pre-rendered shell template.
 
-                /* Tags and categories */
-                .tag {
-                    background-color: var(--secondary);
-                    color: var(--secondary-inverse);
-                    padding: 0.2rem 0.5rem;
-                    border-radius: var(--border-radius);
-                    font-size: 0.8rem;
-                    margin: 0.1rem;
-                    display: inline-block;
-                }
+    FastHTML calls ``__response__`` for route results that define it, so
+    only ``content`` is serialized per request. Boosted htmx navigations
+    get just the content and a title.
+    """
 
-                .category {
-                    color: var(--muted-color);
-                    font-style: italic;
-                }
+    def __init__(self, content):
+        self.content = content
 
-                /* Form sections */
-                .form-section {
-                    background-color: var(--card-background-color);
-                    padding: var(--spacing);
-                    margin: var(--spacing) 0;
-                    border-radius: var(--border-radius);
-                    border: 1px solid var(--muted-border-color);
-                }
+    def render(self) -> bytes:
+        prefix, suffix = _shell_template()
+        body = fast_xml(self.content, indent=fh_cfg.indent)
+        return prefix + body.encode() + suffix
 
-                /* Messages */
-                .error-message {
-                    color: var(--del-color);
-                    background-color: var(--del-color);
-                    background-color: color-mix(in srgb, var(--del-color) 10%, transparent);
-                    padding: var(--spacing);
-                    border-radius: var(--border-radius);
-                    margin: 0.5rem 0;
-                    border: 1px solid var(--del-color);
-                }
+    def render_partial(self) -> bytes:
+        title = ft.Title(t("shared.app_title"))
+        return fast_xml((title, self.content), indent=fh_cfg.indent).encode()
 
-                .success-message {
-                    color: var(--ins-color);
-                    background-color: color-mix(in srgb, var(--ins-color) 10%, transparent);
-                    padding: var(--spacing);
-                    border-radius: var(--border-radius);
-                    margin: 0.5rem 0;
-                    border: 1px solid var(--ins-color);
-                }
+    def __response__(self, req) -> HTMLResponse:
+        headers = {"Vary": "HX-Request, HX-History-Restore-Request"}
+        if is_partial_request(req):
+            return HTMLResponse(self.render_partial(), headers=headers)
+        return HTMLResponse(self.render(), headers=headers)
 
-                /* Category and tag cards */
-                .category-card, .tag-card {
-                    background-color: var(--card-background-color);
-                    border: 1px solid var(--muted-border-color);
-                    padding: var(--spacing);
-                    margin: 0.5rem 0;
-                    border-radius: var(--border-radius);
-                }
 
-                /* Container adjustments */
-                #content {
-                    padding: 2rem;
-                    max-width: 1200px;
-                    margin: 0 auto;
-                }
+def _if_none_match(req) -> set:
+    """Entity tags from If-None-Match, weak prefixes dropped."""
+    header = req.headers.get("if-none-match", "")
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
 
-                /* Responsive adjustments */
-                @media (max-width: 768px) {
-                    nav {
-                        flex-direction: column;
-                        align-items: flex-start;
-                    }
 
-                    nav ul {
-                        flex-wrap: wrap;
-                        margin-top: 1rem;
-                    }
+def conditional_fragment(req, fragment):
+    """Send an htmx fragment with a weak ETag, or 304 if it is unchanged.
 
-                    nav ul li a {
-                        padding: 0.25rem 0.5rem;
-                        font-size: 0.9rem;
-                    }
-                }
+    The tag hashes the rendered bytes, which already reflect the backend
+    data and the active language. It is weak (``W/``) in both the 200 and
+    the 304 because CompressionMiddleware weakens tags on compressed
+    bodies, and clients must see the same validator either way.
 
-                /* Loading spinner */
-                .loading {
-                    text-align: center;
-                    padding: 2rem;
-                    color: var(--muted-color);
-                }
+    The fragment is rendered before the comparison, so a 304 saves only
+    the transfer, not the backend call or the render. htmx still swaps:
+    its XHR sees the browser's cached body as a plain 200. Non-htmx
+    requests get ``fragment`` back untouched so FastHTML still wraps it
+    in a full page.
+    """
+    if "hx-request" not in req.headers:
+        return fragment
+    body = fast_xml(fragment, indent=fh_cfg.indent).encode()
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    headers = {
+        "ETag": f'W/"{digest}"',
+        # Let the browser keep the body but always revalidate it
+        "Cache-Control": "no-cache",
+        "Vary": "HX-Request, HX-History-Restore-Request",
+    }
+    if f'"{digest}"' in _if_none_match(req):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
+
+def shell(content) -> Shell:
+    """Main page shell with navigation, PicoCSS, and dark mode support."""
+    return Shell(content)
+
+
+# Moves a streamed <template id="fill-X"> into element #X and drops its
+# hx-trigger="load" so htmx does not fetch the section a second time.
+_FILL_SCRIPT = b"""<script>
+function fridaiFill(id) {
+  var tpl = document.getElementById('fill-' + id), el = document.getElementById(id);
+  if (!tpl || !el) return;
+  el.replaceChildren(tpl.content);
+  tpl.remove();
+  el.removeAttribute('aria-busy');
+  var triggers = (el.getAttribute('hx-trigger') || '').split(',')
+    .map(function (s) { return s.trim(); })
+    .filter(function (s) { return s && s !== 'load'; });
+  if (triggers.length) el.setAttribute('hx-trigger', triggers.join(', '));
+  else el.removeAttribute('hx-trigger');
+}
+</script>
+"""
+
+
+class StreamingShell(Shell):
+    """Shell that flushes the page skeleton first, then streams sections.
+
+    ``sections`` maps the id of a lazy placeholder in ``content`` to a
+    coroutine function rendering its fragment. Fragments are sent in
+    completion order as <template> chunks that an inline script moves into
+    place. Sections that fail or miss ``budget`` keep their placeholder,
+    whose hx-trigger="load" fetches them once the document has loaded.
+    """
 
-                /* Grid layouts */
-                .grid-2 {
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                    gap: var(--spacing);
-                }
+    def __init__(
+        self,
+        content,
+        sections: Dict[str, Callable[[], Awaitable[Any]]],
+        budget: float,
+    ):
+        super().__init__(content)
+        self.sections = sections
+        self.budget = budget
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        prefix, suffix = _shell_template()
+        body = fast_xml(self.content, indent=fh_cfg.indent)
+        yield prefix + body.encode() + _FILL_SCRIPT
+
+        tasks = {
+            asyncio.ensure_future(fn()): slot
+            for slot, fn in self.sections.items()
+        }
+        pending = set(tasks)
+        deadline = time.monotonic() + clamp(self.budget)
+        try:
+            while pending:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=left, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        yield self._fill(tasks[task], task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        yield suffix
+
+    @staticmethod
+    def _fill(slot: str, fragment) -> bytes:
+        html = fast_xml(fragment, indent=fh_cfg.indent)
+        return (
+            f'<template id="fill-{slot}">{html}</template>'
+            f'<script>fridaiFill("{slot}")</script>\n'
+        ).encode()
+
+    def __response__(self, req):
+        # htmx swaps whole responses, so partial navigations stay lazy
+        if is_partial_request(req):
+            return super().__response__(req)
+        return StreamingResponse(
+            self.stream(),
+            media_type="text/html; charset=utf-8",
+            headers={
+                "Vary": "HX-Request, HX-History-Restore-Request",
+                # Ask reverse proxies not to buffer the early flush away
+                "X-Accel-Buffering": "no",
+            },
+        )
 
-                /* Theme toggle animation */
-                #theme-toggle {
-                    transition: transform 0.3s;
-                }
 
-                #theme-toggle:hover {
-                    transform: rotate(20deg);
-                }
-            """
-            ),
-            ft.Script(
-                f"""
-                // Theme management
-                function getStoredTheme() {{
-                    return localStorage.getItem('theme') || 'dark';
-                }}
-
-                function setTheme(theme) {{
-                    if (theme === 'auto') {{
-                        // Remove data-theme to use system preference
-                        document.documentElement.removeAttribute('data-theme');
-                    }} else {{
-                        document.documentElement.setAttribute('data-theme', theme);
-                    }}
-                    localStorage.setItem('theme', theme);
-                    updateThemeToggle(theme);
-                }}
-
-                function updateThemeToggle(theme) {{
-                    const toggle = document.getElementById('theme-toggle');
-                    if (toggle) {{
-                        if (theme === 'dark') {{
-                            toggle.textContent = '🌙';
-                            toggle.setAttribute('aria-label', '{js_switch_to_light}');
-                        }} else if (theme === 'light') {{
-                            toggle.textContent = '☀️';
-                            toggle.setAttribute('aria-label', '{js_switch_to_dark}');
-                        }} else {{
-                            toggle.textContent = '🌓';
-                            toggle.setAttribute('aria-label', '{js_switch_to_manual}');
-                        }}
-                    }}
-                }}
-
-                function toggleTheme() {{
-                    const currentTheme = getStoredTheme();
-                    let newTheme;
-
-                    if (currentTheme === 'dark') {{
-                        newTheme = 'light';
-                    }} else if (currentTheme === 'light') {{
-                        newTheme = 'auto';
-                    }} else {{
-                        newTheme = 'dark';
-                    }}
-
-                    setTheme(newTheme);
-                }}
-
-                // Initialize theme on page load
-                document.addEventListener('DOMContentLoaded', function() {{
-                    const storedTheme = getStoredTheme();
-                    setTheme(storedTheme);
-                }});
-
-                // Set initial theme immediately (before DOMContentLoaded)
-                (function() {{
-                    const theme = getStoredTheme();
-                    if (theme !== 'auto') {{
-                        document.documentElement.setAttribute('data-theme', theme);
-                    }}
-                }})();
-                """
-            ),
-        ),
-        ft.Body(
-            nav(),
-            ft.Main(
-                ft.Div(content, id="content"),
-                **{"class": "container-fluid"}          # type: ignore
-            ),
-            ft.Script(
-                f"""
-                    // HTMX event handlers
-                    document.body.addEventListener('htmx:responseError', function(evt) {{
-                        console.error('HTMX Error:', evt.detail);
-                        const errorMsg = document.createElement('div');
-                        errorMsg.className = 'error-message';
-                        errorMsg.textContent = '{js_htmx_error}';
-                        errorMsg.style.position = 'fixed';
-                        errorMsg.style.top = '20px';
-                        errorMsg.style.right = '20px';
-                        errorMsg.style.zIndex = '9999';
-                        document.body.appendChild(errorMsg);
-                        setTimeout(() => errorMsg.remove(), 5000);
-                    }});
-
-                    document.body.addEventListener('htmx:afterSwap', function(evt) {{
-                        evt.detail.elt.removeAttribute('aria-busy');
-                    }});
-
-                    // Preserve theme across HTMX navigations
-                    document.body.addEventListener('htmx:configRequest', function(evt) {{
-                        evt.detail.headers['X-Theme'] = getStoredTheme();
-                    }});
-                """
-            ),
-        ),
-        **{"data-theme": "dark"}  # Set dark as default         # type: ignore
-    )
+def streaming_shell(
+    content,
+    sections: Dict[str, Callable[[], Awaitable[Any]]],
+    budget: float,
+) -> StreamingShell:
+    """Like ``shell()``, but streams ``sections`` in as they resolve."""
+    return StreamingShell(content, sections, budget)
 
 
 def task_card(
@@ -494,6 +444,38 @@ def task_card(
     )
 
 
+# Serialized task cards, bounded by count and by total characters of HTML
+task_card_cache = LRUCache(max_entries=4096, max_bytes=4 * 1024 * 1024, sizeof=len)
+on_reload(task_card_cache.clear)
+
+
+def cached_task_card(
+    task: Dict[str, Any],
+    category_map: Optional[Dict[int, str]] = None,
+    tag_map: Optional[Dict[int, str]] = None,
+) -> NotStr:
+    """``task_card`` rendered to HTML once and reused while unchanged.
+
+    The key covers everything the card depends on: the task's content,
+    the active language and the names its category and tags resolve to.
+    """
+    digest = hashlib.blake2b(
+        json.dumps(task, sort_keys=True, default=str).encode(), digest_size=16
+    ).digest()
+    category_id = task.get('category_id')
+    key = (
+        digest,
+        get_language(),
+        category_map.get(category_id) if category_map else None,
+        tuple(tag_map.get(tid) for tid in task.get('tag_ids') or ()) if tag_map else (),
+    )
+    html = task_card_cache.get(key)
+    if html is None:
+        html = fast_xml(task_card(task, category_map, tag_map), indent=fh_cfg.indent)
+        task_card_cache.put(key, html)
+    return NotStr(html)
+
+
 def loading_spinner():
     """Simple loading indicator"""
     return ft.Div(
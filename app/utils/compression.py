@@ -0,0 +1,248 @@
+# utils/compression.py
+
+import time
+import zlib
+from typing import Callable, Dict, Optional, Set
+
+try:
+    import brotli
+except ImportError:  # optional: pip install "frontend[brotli]"
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install "frontend[zstd]"
+    zstandard = None
+
+# Most preferred first; codings whose library is missing are skipped
+PREFERENCE = ("zstd", "br", "gzip")
+
+# Compression level per media type and coding. Types not listed here are
+# sent as-is. Pages and fragments are compressed on every request, so they
+# get fast levels; static assets are precompressed, so these rarely apply.
+DEFAULT_LEVELS: Dict[str, Dict[str, int]] = {
+    "text/html": {"zstd": 3, "br": 4, "gzip": 6},
+    "application/json": {"zstd": 3, "br": 4, "gzip": 6},
+    "text/plain": {"zstd": 3, "br": 4, "gzip": 6},
+    "text/css": {"zstd": 9, "br": 8, "gzip": 9},
+    "text/javascript": {"zstd": 9, "br": 8, "gzip": 9},
+    "application/javascript": {"zstd": 9, "br": 8, "gzip": 9},
+    "image/svg+xml": {"zstd": 9, "br": 8, "gzip": 9},
+}
+
+
+def accepted_encodings(header: str) -> Set[str]:
+    """Parse an Accept-Encoding header into the codings with q > 0."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(coding)
+    return accepted
+
+
+def available_codings() -> tuple:
+    """Codings this process can produce, most preferred first."""
+    return tuple(
+        c for c in PREFERENCE
+        if c == "gzip"
+        or (c == "br" and brotli is not None)
+        or (c == "zstd" and zstandard is not None)
+    )
+
+
+class _Encoder:
+    """Incremental compressor; ``final=False`` flushes so chunks decode early."""
+
+    def __init__(self, coding: str, level: int):
+        self.coding = coding
+        if coding == "gzip":
+            self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+        elif coding == "br":
+            self._z = brotli.Compressor(quality=level)
+        else:
+            self._z = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.coding == "gzip":
+            out = self._z.compress(data)
+            return out + (self._z.flush() if final else self._z.flush(zlib.Z_SYNC_FLUSH))
+        if self.coding == "br":
+            out = self._z.process(data)
+            return out + (self._z.finish() if final else self._z.flush())
+        mode = (
+            zstandard.COMPRESSOBJ_FLUSH_FINISH if final
+            else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+        out = self._z.compress(data)
+        return out + self._z.flush(mode)
+
+
+class CPUBudget:
+    """Caps the share of one core spent compressing, per fixed window.
+
+    ``fraction`` of 0.5 allows 0.5s of compression per second. Once spent,
+    responses go out uncompressed until the window rolls over. A fraction
+    of zero or less removes the cap.
+    """
+
+    def __init__(
+        self,
+        fraction: float,
+        window: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fraction = fraction
+        self.window = window
+        self._clock = clock
+        self._started = clock()
+        self._spent = 0.0
+        self.exhausted = 0
+
+    def allow(self) -> bool:
+        if self.fraction <= 0:
+            return True
+        now = self._clock()
+        if now - self._started >= self.window:
+            self._started, self._spent = now, 0.0
+        if self._spent < self.fraction * self.window:
+            return True
+        self.exhausted += 1
+        return False
+
+    def charge(self, seconds: float) -> None:
+        self._spent += seconds
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with zstd, brotli or gzip.
+
+    The coding is negotiated from Accept-Encoding (zstd > br > gzip among
+    installed libraries). Responses are left alone when they already carry
+    a Content-Encoding, ask for no-transform, have a media type without a
+    configured level, or fit in one body message under ``minimum_size``.
+    Streamed bodies are compressed chunk by chunk and flushed, so early
+    flushes still reach the client early.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 500,
+        levels: Optional[Dict[str, Dict[str, int]]] = None,
+        cpu_budget: float = 0.5,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {k: dict(v) for k, v in DEFAULT_LEVELS.items()}
+        for media_type, per_coding in (levels or {}).items():
+            self.levels.setdefault(media_type, {}).update(per_coding)
+        self.budget = CPUBudget(cpu_budget)
+        self.codings = available_codings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        header = b""
+        for name, value in scope.get("headers", []):
+            if name.lower() == b"accept-encoding":
+                header = value
+                break
+        accepted = accepted_encodings(header.decode("latin-1"))
+        codings = [c for c in self.codings if c in accepted]
+        if not codings:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _Responder(self, codings, send))
+
+
+class _Responder:
+    """Wraps ``send`` for one response and decides whether to compress it."""
+
+    def __init__(self, middleware: CompressionMiddleware, codings, send):
+        self.mw = middleware
+        self.codings = codings
+        self.send = send
+        self.start: Optional[dict] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        body = message.get("body", b"")
+        more = message.get("more_body", False)
+        first = self.encoder is None
+        if first:
+            self.encoder = self._choose_encoder(body, more)
+            if self.encoder is None:
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+        started = time.perf_counter()
+        data = self.encoder.compress(body, final=not more)
+        self.mw.budget.charge(time.perf_counter() - started)
+        if first:
+            # A single-message body keeps an exact Content-Length
+            await self.send(self._compressed_start(None if more else len(data)))
+        await self.send(
+            {"type": "http.response.body", "body": data, "more_body": more}
+        )
+
+    def _choose_encoder(self, body: bytes, more: bool) -> Optional[_Encoder]:
+        headers = {k.lower(): v for k, v in self.start.get("headers", [])}
+        if self.start["status"] in (204, 206, 304) or b"content-encoding" in headers:
+            return None
+        if b"no-transform" in headers.get(b"cache-control", b""):
+            return None
+        media_type = headers.get(b"content-type", b"").split(b";")[0].strip()
+        levels = self.mw.levels.get(media_type.decode("latin-1").lower())
+        if not levels:
+            return None
+        if not more and len(body) < self.mw.minimum_size:
+            return None
+        coding = next((c for c in self.codings if c in levels), None)
+        if coding is None or not self.mw.budget.allow():
+            return None
+        return _Encoder(coding, levels[coding])
+
+    def _compressed_start(self, length: Optional[int]) -> dict:
+        headers = []
+        vary = None
+        for name, value in self.start.get("headers", []):
+            lname = name.lower()
+            if lname == b"content-length":
+                continue
+            if lname == b"vary":
+                vary = value
+                continue
+            if lname == b"etag" and not value.startswith(b"W/"):
+                # The compressed bytes differ, so only weak equality holds
+                value = b"W/" + value
+            headers.append((name, value))
+        headers.append((b"content-encoding", self.encoder.coding.encode()))
+        if vary is None:
+            vary = b"Accept-Encoding"
+        elif b"accept-encoding" not in vary.lower():
+            vary += b", Accept-Encoding"
+        headers.append((b"vary", vary))
+        if length is not None:
+            headers.append((b"content-length", str(length).encode()))
+        return {**self.start, "headers": headers}
@@ -0,0 +1,158 @@
+# utils/concurrency.py
+
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from app.utils.deadline import bind, clamp, current, remaining
+
+
+async def gather_within(
+    calls: Dict[str, Awaitable[Any]],
+    timeout: float,
+    per_call_timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Run awaitables concurrently under one shared deadline.
+
+    Returns a dict with the same keys as ``calls``. Each value is either the
+    call's result or the exception it raised. Calls still pending when the
+    deadline passes are cancelled and reported as ``asyncio.TimeoutError``,
+    so callers can render whatever did arrive. ``per_call_timeout`` bounds
+    each call individually on top of the shared deadline.
+    """
+    if per_call_timeout is not None:
+        calls = {
+            key: asyncio.wait_for(aw, per_call_timeout)
+            for key, aw in calls.items()
+        }
+    tasks = {key: asyncio.ensure_future(aw) for key, aw in calls.items()}
+    if not tasks:
+        return {}
+    try:
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    finally:
+        unfinished = [task for task in tasks.values() if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+    results: Dict[str, Any] = {}
+    for key, task in tasks.items():
+        if task in pending or task.cancelled():
+            results[key] = asyncio.TimeoutError(
+                f"'{key}' did not finish within {timeout:g}s"
+            )
+        elif task.exception() is not None:
+            results[key] = task.exception()
+        else:
+            results[key] = task.result()
+    return results
+
+
+async def prefetch(
+    calls: Dict[str, Callable[[], Awaitable[Any]]],
+    budget: float,
+) -> Dict[str, Any]:
+    """Start ``calls`` concurrently and keep those that succeed in ``budget``.
+
+    Used for server-side first paint: keys missing from the result (timed
+    out or failed) fall back to lazy loading. A budget of zero or less
+    skips the calls entirely.
+    """
+    if budget <= 0:
+        return {}
+    results = await gather_within(
+        {key: fn() for key, fn in calls.items()}, clamp(budget)
+    )
+    return {
+        key: value for key, value in results.items()
+        if not isinstance(value, BaseException)
+    }
+
+
+class _Flight:
+    """One shared call and the deadlines of the callers waiting on it."""
+
+    def __init__(self):
+        self.context = contextvars.Context()
+        self.task: Optional[asyncio.Task] = None
+        self.deadlines: List[Optional[float]] = []
+
+    def rebind(self) -> None:
+        """Run the call under the latest deadline among its waiters."""
+        if not self.deadlines or None in self.deadlines:
+            latest = None
+        else:
+            latest = max(self.deadlines)
+        bind(self.context, latest)
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls into one shared execution.
+
+    The first caller for a key (a miss) starts the call; callers arriving
+    while it is still running (hits) await the same result.
+
+    The shared call runs in its own context under the latest deadline
+    among its current waiters, updated as they come and go. Each waiter
+    gives up on its own deadline with ``asyncio.TimeoutError``; when the
+    last one leaves, the shared call is cancelled.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``fn`` for ``key`` unless an identical call is in flight."""
+        left = remaining()
+        if left is not None and left <= 0:
+            raise asyncio.TimeoutError("request deadline already passed")
+        flight = self._inflight.get(key)
+        if flight is None:
+            self.misses += 1
+            flight = self._inflight[key] = _Flight()
+        else:
+            self.hits += 1
+        mine = current()
+        flight.deadlines.append(mine)
+        flight.rebind()
+        if flight.task is None:
+            flight.task = asyncio.get_running_loop().create_task(
+                fn(), context=flight.context
+            )
+            flight.task.add_done_callback(
+                lambda t, f=flight: self._forget(key, f)
+            )
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight.task), left)
+        finally:
+            flight.deadlines.remove(mine)
+            if not flight.task.done():
+                if flight.deadlines:
+                    flight.rebind()
+                else:
+                    flight.task.cancel()
+                    self._forget(key, flight)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current fan-in ratio."""
+        total = self.hits + self.misses
+        return {
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "fan_in": round(total / self.misses, 3) if self.misses else 0.0,
+        }
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every waiter went away
+        task = flight.task
+        if task.done() and not task.cancelled():
+            task.exception()
@@ -0,0 +1,88 @@
+# utils/deadline.py
+
+import time
+from contextlib import contextmanager
+from contextvars import Context, ContextVar
+from typing import Iterator, Optional
+
+# Absolute time.monotonic() value by which the current request must finish
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+DEADLINE_HEADER = "x-request-timeout"
+
+
+def current() -> Optional[float]:
+    """Absolute ``time.monotonic()`` deadline of the current request, or None."""
+    return _DEADLINE.get()
+
+
+def bind(context: Context, deadline: Optional[float]) -> None:
+    """Set the deadline seen by code running in ``context``.
+
+    ``context`` must not be the one running the caller; it is meant for
+    tasks created with an explicit context (see SingleFlight).
+    """
+    context.run(_DEADLINE.set, deadline)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current request's budget, or None if unbounded."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def clamp(timeout: float) -> float:
+    """Shrink ``timeout`` to the time left in the current request's budget."""
+    left = remaining()
+    if left is None:
+        return timeout
+    return max(0.0, min(timeout, left))
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """Run the enclosed block under a deadline ``seconds`` from now.
+
+    A nested scope can only tighten an outer deadline, never extend it.
+    """
+    deadline = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+class DeadlineMiddleware:
+    """ASGI middleware that gives each HTTP request a deadline.
+
+    The budget is ``default`` seconds. A client may ask for a shorter one
+    with the ``X-Request-Timeout`` header (seconds); longer values are
+    capped at the default.
+    """
+
+    def __init__(self, app, default: float = 10.0):
+        self.app = app
+        self.default = default
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.default <= 0:
+            await self.app(scope, receive, send)
+            return
+        seconds = self.default
+        for name, value in scope.get("headers", []):
+            if name.decode("latin-1").lower() == DEADLINE_HEADER:
+                try:
+                    requested = float(value.decode("latin-1"))
+                except ValueError:
+                    break
+                if requested > 0:
+                    seconds = min(seconds, requested)
+                break
+        with deadline_scope(seconds):
+            await self.app(scope, receive, send)
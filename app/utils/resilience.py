@@ -0,0 +1,175 @@
+# utils/resilience.py
+
+import random
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed:    calls flow; ``failure_threshold`` consecutive failures open it.
+    open:      calls are rejected until ``reset_timeout`` seconds pass.
+    half_open: one probe call is let through; success closes the circuit,
+               failure re-opens it for another ``reset_timeout``.
+
+    A ``failure_threshold`` of zero disables the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed, False to fail fast."""
+        if self.failure_threshold <= 0:
+            return True
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self.failure_threshold <= 0:
+            return
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """Free the half-open probe slot without recording an outcome."""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker state for health and metrics endpoints."""
+        state = self.state
+        retry_in = 0.0
+        if state == self.OPEN:
+            retry_in = max(
+                0.0, self.reset_timeout - (self._clock() - self._opened_at)
+            )
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "retry_in": round(retry_in, 3),
+            "rejected": self.rejected,
+        }
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a retry budget.
+
+    Every first attempt deposits ``budget_ratio`` tokens (up to
+    ``max_tokens``) and every retry or hedge withdraws one, so extra load
+    sent to a struggling backend stays proportional to normal traffic.
+    ``max_attempts`` of 1 disables retries.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 1,
+        base_delay: float = 0.05,
+        max_delay: float = 1.0,
+        budget_ratio: float = 0.1,
+        max_tokens: float = 10.0,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._rng = rng
+        self.retries = 0
+        self.budget_exhausted = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based)."""
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self._rng() * cap
+
+    def deposit(self) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + self.budget_ratio)
+
+    def try_spend(self) -> bool:
+        """Take one token for a retry or hedge; False if the budget is spent."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.retries += 1
+            return True
+        self.budget_exhausted += 1
+        return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_attempts": self.max_attempts,
+            "tokens": round(self._tokens, 3),
+            "retries": self.retries,
+            "budget_exhausted": self.budget_exhausted,
+        }
+
+
+class LatencyTracker:
+    """Rolling windows of request latencies, one per key (e.g. endpoint).
+
+    Keeping endpoints apart stops fast calls (health checks, small
+    lookups) from dragging down the percentile of slow ones.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {}
+
+    def record(self, seconds: float, key: str = "") -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, q: float, key: str = "") -> Optional[float]:
+        """Return the ``q`` quantile for ``key``, or None until enough samples exist."""
+        samples = self._samples.get(key, ())
+        if len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
@@ -0,0 +1,99 @@
+# utils/serializer.py
+
+from html import escape
+from typing import Any, List
+
+from fastcore.xml import FT, _block_tags, _to_xml, to_xml
+
+# Element shapes the app emits in bulk (task cards and their wrappers).
+# Anything else is handed to fastcore's generic serializer.
+FAST_TAGS = frozenset({"article", "div", "p", "span", "button", "h4"})
+_BLOCK = {tag: tag in _block_tags for tag in FAST_TAGS}
+
+
+def _attr(k: str, v: Any) -> str:
+    if v is True:
+        return k
+    if isinstance(v, str):
+        v = escape(v, quote=False)
+    elif hasattr(v, "__html__"):
+        v = v.__html__()
+    elif isinstance(v, (int, float)) and not isinstance(v, bool):
+        v = str(v)
+    else:
+        return ""  # not reached for fast-path elements, see _is_fast()
+    if '"' in v:
+        return f"{k}='{v.replace(chr(39), '&#39;')}'" if "'" in v else f"{k}='{v}'"
+    return f'{k}="{v}"'
+
+
+def _is_fast(elm: FT) -> bool:
+    if elm.tag not in FAST_TAGS or getattr(elm, "void_", False):
+        return False
+    for k, v in elm.attrs.items():
+        if k == "contenteditable" and v == "true":
+            return False
+        # Mappings, lists and other exotic values keep the generic path
+        if not isinstance(v, (str, int, float)) and v is not None and not hasattr(v, "__html__"):
+            return False
+    return True
+
+
+def _write(elm: FT, lvl: int, indent: bool, out: List[str]) -> None:
+    tag, cs, attrs = elm.tag, elm.children, elm.attrs
+    if indent and _BLOCK[tag]:
+        sp, nl = " " * lvl, "\n"
+    else:
+        sp, nl = "", ""
+    stag = tag
+    if attrs:
+        sattrs = " ".join(
+            _attr(k, v) for k, v in attrs.items()
+            if v not in (False, None, "") and (k == "_" or k[-1] != "_")
+        )
+        if sattrs:
+            stag = f"{tag} {sattrs}"
+    if not cs:
+        out.append(f"{sp}<{stag}></{tag}>{nl}")
+        return
+    if len(cs) == 1:
+        c = cs[0]
+        if not isinstance(c, (list, tuple, FT)) and not hasattr(c, "__ft__"):
+            if c is None:
+                c = ""
+            elif hasattr(c, "__html__"):
+                c = c.__html__()
+            elif isinstance(c, str):
+                c = escape(c)
+            out.append(f"{sp}<{stag}>{c}</{tag}>{nl}")
+            return
+    out.append(f"{sp}<{stag}>{nl}")
+    child_lvl = lvl + 2 if indent else 0
+    for c in cs:
+        _serialize(c, child_lvl, indent, out)
+    out.append(f"{sp}</{tag}>{nl}")
+
+
+def _serialize(elm: Any, lvl: int, indent: bool, out: List[str]) -> None:
+    if isinstance(elm, FT) and _is_fast(elm):
+        _write(elm, lvl, indent, out)
+    elif isinstance(elm, str) and not hasattr(elm, "__html__"):
+        out.append(escape(elm))
+    elif isinstance(elm, tuple):
+        for o in elm:
+            _serialize(o, lvl, indent, out)
+    else:
+        out.append(_to_xml(elm, lvl=lvl, indent=indent))
+
+
+def fast_xml(elm: Any, indent: bool = True) -> str:
+    """Serialize ``elm`` exactly as ``fastcore.xml.to_xml`` would, faster.
+
+    Article/Div/P/Span/Button/H4 elements with plain attribute values take
+    a specialized path; every other node falls back to fastcore.
+    """
+    if not isinstance(elm, (FT, tuple)):
+        return to_xml(elm, indent=indent)
+    out: List[str] = []
+    _serialize(elm, 0, indent, out)
+    return "".join(out)
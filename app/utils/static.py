@@ -0,0 +1,235 @@
+# utils/static.py
+
+import base64
+import gzip
+import hashlib
+import logging
+import mimetypes
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.utils.compression import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # optional: pip install "frontend[brotli]"
+    brotli = None
+
+logger = logging.getLogger("fridai.frontend.static")
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_PREFIX = "/static"
+
+# Fingerprinted URLs never change content, so browsers may cache forever
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Third-party libraries committed under STATIC_DIR/vendor: upstream URL and
+# the Subresource Integrity digest the bytes must match. The app refuses to
+# start if a file is missing or altered; ``python -m app.utils.static``
+# re-downloads them after a version bump.
+VENDOR: Dict[str, Tuple[str, str]] = {
+    "vendor/htmx.min.js": (
+        "https://unpkg.com/htmx.org@1.9.10/dist/htmx.min.js",
+        # As published in htmx's 1.9.10 install instructions
+        "sha384-D1Kt99CQMDuVetoL1lrYwg5t+9QdHe7NLX/SoJYkXDFfX37iInKRy5xLSi8nO7UC",
+    ),
+    "vendor/pico.min.css": (
+        "https://cdn.jsdelivr.net/npm/@picocss/pico@1.5.10/css/pico.min.css",
+        # app.css and the inline styles use Pico 1 variable names
+        "sha384-JnI9fsy7u0hXe2CXur8V8MkHfeqi2q7x6KYi4DbEYIjZJuP2Z2eMlp2RbdO7p3zL",
+    ),
+}
+
+# Below this size compression overhead outweighs the savings
+MIN_COMPRESS_SIZE = 256
+COMPRESSIBLE = ("text/", "application/javascript", "image/svg+xml")
+
+
+class Asset:
+    """A static file held in memory under a content-hashed filename.
+
+    Compressible files also keep gzip (and, when the ``brotli`` package is
+    installed, br) variants built once at load time. Each representation
+    has its own strong ETag.
+    """
+
+    def __init__(self, name: str, content: bytes):
+        self.name = name
+        self.content = content
+        self.digest = hashlib.sha256(content).hexdigest()
+        self.etag = f'"{self.digest[:32]}"'
+        self.content_type = (
+            mimetypes.guess_type(name)[0] or "application/octet-stream"
+        )
+        if self.content_type.startswith("text/") or name.endswith(".js"):
+            self.content_type += "; charset=utf-8"
+        stem, _, ext = name.rpartition(".")
+        self.filename = f"{stem}.{self.digest[:12]}.{ext}"
+        self.variants: Dict[str, bytes] = {}
+        if len(content) >= MIN_COMPRESS_SIZE and self.content_type.startswith(
+            COMPRESSIBLE
+        ):
+            self._precompress()
+
+    def _precompress(self) -> None:
+        candidates = {"gzip": gzip.compress(self.content, 9, mtime=0)}
+        if brotli is not None:
+            candidates["br"] = brotli.compress(self.content, quality=11)
+        for coding, body in candidates.items():
+            if len(body) < len(self.content):
+                self.variants[coding] = body
+
+    @property
+    def url(self) -> str:
+        return f"{STATIC_PREFIX}/{self.filename}"
+
+    def negotiate(self, accept_encoding: str) -> Optional[str]:
+        """Pick the smallest precompressed variant the client accepts."""
+        if not self.variants:
+            return None
+        accepted = accepted_encodings(accept_encoding)
+        usable = [c for c in self.variants if c in accepted or "*" in accepted]
+        if not usable:
+            return None
+        return min(usable, key=lambda c: len(self.variants[c]))
+
+    def etag_for(self, coding: Optional[str]) -> str:
+        if coding is None:
+            return self.etag
+        return f'"{self.digest[:32]}-{coding}"'
+
+
+class AssetRegistry:
+    """Loads every file under a directory and serves it by hashed name."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._by_name: Dict[str, Asset] = {}
+        self._by_filename: Dict[str, Asset] = {}
+        for path in sorted(directory.rglob("*")):
+            if path.is_file():
+                name = path.relative_to(directory).as_posix()
+                asset = Asset(name, path.read_bytes())
+                self._by_name[name] = asset
+                self._by_filename[asset.filename] = asset
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def url(self, name: str) -> str:
+        """Return the fingerprinted URL for a logical asset name."""
+        return self._by_name[name].url
+
+    def vendor_url(self, name: str) -> str:
+        """Local URL for a vendored library.
+
+        Never points at the CDN. A library missing from the tree keeps its
+        plain path; ``check_vendored`` stops the app starting in that case.
+        """
+        if name in self._by_name:
+            return self.url(name)
+        return f"{STATIC_PREFIX}/{name}"
+
+    def check_vendored(self) -> None:
+        """Raise RuntimeError unless every VENDOR file is present and intact."""
+        problems = []
+        for name in VENDOR:
+            asset = self._by_name.get(name)
+            if asset is None:
+                problems.append(f"{name} is missing")
+                continue
+            try:
+                verify(name, asset.content)
+            except ValueError as e:
+                problems.append(str(e))
+        if problems:
+            raise RuntimeError(
+                "Vendored libraries are not usable: " + "; ".join(problems)
+                + ". Restore app/static/vendor from git or run"
+                " `python -m app.utils.static` to fetch them again."
+            )
+
+    def lookup(self, filename: str) -> Optional[Asset]:
+        return self._by_filename.get(filename)
+
+    def response(self, request: Request, filename: str) -> Response:
+        """Serve ``filename`` with immutable caching and ETag revalidation."""
+        asset = self.lookup(filename)
+        if asset is None:
+            return Response("404 Not Found", status_code=404)
+        coding = asset.negotiate(request.headers.get("accept-encoding", ""))
+        etag = asset.etag_for(coding)
+        headers = {"Cache-Control": IMMUTABLE, "ETag": etag}
+        if asset.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if_none_match = request.headers.get("if-none-match", "")
+        if if_none_match.strip() == "*" or etag in (
+            tag.strip() for tag in if_none_match.split(",")
+        ):
+            return Response(status_code=304, headers=headers)
+        if coding is None:
+            return Response(
+                asset.content, media_type=asset.content_type, headers=headers
+            )
+        headers["Content-Encoding"] = coding
+        return Response(
+            asset.variants[coding],
+            media_type=asset.content_type,
+            headers=headers,
+        )
+
+
+def integrity(data: bytes, algorithm: str = "sha384") -> str:
+    """Subresource Integrity string (``sha384-<base64>``) for ``data``."""
+    digest = hashlib.new(algorithm, data).digest()
+    return f"{algorithm}-{base64.b64encode(digest).decode()}"
+
+
+def verify(name: str, data: bytes) -> None:
+    """Raise ValueError unless ``data`` matches the pinned digest for ``name``."""
+    _, pinned = VENDOR[name]
+    algorithm = pinned.partition("-")[0]
+    actual = integrity(data, algorithm)
+    if actual != pinned:
+        raise ValueError(f"{name} digest mismatch: expected {pinned}, got {actual}")
+
+
+def vendor(directory: Path = STATIC_DIR) -> None:
+    """Download the pinned third-party libraries into ``directory``.
+
+    Every file is checked against its pinned digest before it is written.
+    """
+    import httpx
+
+    for name, (url, _) in VENDOR.items():
+        resp = httpx.get(url, follow_redirects=True, timeout=30.0)
+        resp.raise_for_status()
+        verify(name, resp.content)
+        target = directory / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(resp.content)
+        logger.info(f"Vendored {url} -> {target}")
+
+
+def digests(paths: List[str]) -> None:
+    """Print the integrity string of local files, for pinning in VENDOR."""
+    for path in paths:
+        print(f"{integrity(Path(path).read_bytes())}  {path}")
+
+
+assets = AssetRegistry(STATIC_DIR)
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    if sys.argv[1:2] == ["--digest"]:
+        digests(sys.argv[2:])
+    elif sys.argv[1:2] == ["--check"]:
+        assets.check_vendored()
+    else:
+        vendor()
@@ -0,0 +1,68 @@
+"""t() throughput: the nested dict walk vs the compiled flat catalog.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_i18n [calls] [repeats]
+"""
+
+import sys
+import timeit
+from typing import Any
+
+from app.i18n import loader, t
+
+
+def walk(key: str, **kwargs: Any) -> str:
+    """t() as it was before compilation: split, walk, str.format."""
+    node: Any = loader._STRINGS
+    for part in key.split("."):
+        if isinstance(node, dict):
+            node = node.get(part)
+        else:
+            return key
+    if node is None:
+        return key
+    result = str(node)
+    if kwargs:
+        try:
+            result = result.format(**kwargs)
+        except (KeyError, IndexError):
+            pass
+    return result
+
+
+# A task card's worth of lookups: plain labels plus interpolated strings
+CALLS = [
+    ("task_card.untitled", {}),
+    ("task_card.complete_button", {}),
+    ("task_card.delete_confirm", {}),
+    ("nav.home", {}),
+    ("errors.page_load_failed", {"error": "timeout"}),
+    ("errors.loading_tasks", {"error": "timeout"}),
+]
+
+
+def main(calls: int = 100_000, repeats: int = 5) -> None:
+    loader.set_language("en")
+    for key, kwargs in CALLS:
+        assert t(key, **kwargs) == walk(key, **kwargs), key
+    rounds = max(1, calls // len(CALLS))
+    print(f"{rounds * len(CALLS):,} calls, best of {repeats}")
+    baseline = None
+    for name, fn in (("walk", walk), ("t", t)):
+        def run():
+            for _ in range(rounds):
+                for key, kwargs in CALLS:
+                    fn(key, **kwargs)
+
+        best = min(timeit.repeat(run, number=1, repeat=repeats))
+        baseline = baseline or best
+        print(
+            f"{name:<6}{best * 1e3:>9.1f} ms"
+            f"{rounds * len(CALLS) / best:>14,.0f} calls/s{baseline / best:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
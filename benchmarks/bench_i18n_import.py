@@ -0,0 +1,40 @@
+"""Import time of app.i18n: parsing YAML vs loading the marshal cache.
+
+Each sample is a fresh interpreter, so module caches do not carry over.
+Run from the repository root:
+
+    python -m benchmarks.bench_i18n_import [repeats]
+"""
+
+import os
+import subprocess
+import sys
+
+SNIPPET = (
+    "import time; t = time.perf_counter(); import app.i18n; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def _sample(cache: bool) -> float:
+    env = {**os.environ, "I18N_CACHE": "1" if cache else "0"}
+    out = subprocess.run(
+        [sys.executable, "-c", SNIPPET],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout)
+
+
+def main(repeats: int = 10) -> None:
+    _sample(cache=True)  # make sure the cache exists and is current
+    print(f"import app.i18n, best of {repeats}")
+    baseline = None
+    for name, cache in (("yaml", False), ("marshal", True)):
+        best = min(_sample(cache) for _ in range(repeats))
+        baseline = baseline or best
+        print(f"{name:<9}{best * 1e3:>8.1f} ms{baseline / best:>8.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:2]]
+    main(*args)
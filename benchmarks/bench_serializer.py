@@ -0,0 +1,55 @@
+"""Task card serialization throughput: fastcore to_xml vs fast_xml.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_serializer [cards] [repeats]
+"""
+
+import sys
+import timeit
+
+from fasthtml import ft
+from fasthtml.common import to_xml
+
+from app.utils.components import task_card
+from app.utils.serializer import fast_xml
+
+
+def _cards(n: int):
+    category_map = {1: "Work", 2: "Home"}
+    tag_map = {1: "urgent", 2: "later", 3: "errand"}
+    return ft.Div(*[
+        task_card(
+            {
+                "id": i,
+                "title": f"Task {i}",
+                "description": "Something to do & remember",
+                "status": "completed" if i % 5 == 0 else "pending",
+                "due_at": "2026-03-01T12:00:00",
+                "category_id": 1 + i % 2,
+                "tag_ids": [1 + i % 3, 1 + (i + 1) % 3],
+            },
+            category_map,
+            tag_map,
+        )
+        for i in range(n)
+    ])
+
+
+def main(cards: int = 2000, repeats: int = 5) -> None:
+    tree = _cards(cards)
+    assert fast_xml(tree) == to_xml(tree)
+    print(f"{cards} cards, best of {repeats}")
+    baseline = None
+    for name, fn in (("to_xml", to_xml), ("fast_xml", fast_xml)):
+        best = min(timeit.repeat(lambda: fn(tree), number=1, repeat=repeats))
+        baseline = baseline or best
+        print(
+            f"{name:<10}{best * 1e3:>9.1f} ms{cards / best:>12,.0f} cards/s"
+            f"{baseline / best:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,46 @@
+"""Per-request page render cost: full shell tree vs cached shell template.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_shell [iterations]
+"""
+
+import asyncio
+import inspect
+import sys
+import timeit
+
+from fasthtml.common import fh_cfg, to_xml
+
+from app.pages.home import home_page
+from app.pages.tasks import tasks_page
+from app.utils.components import Shell, _shell_tree
+
+
+def _content(page, *args) -> object:
+    """Pull the ``#content`` payload out of a page handler's result."""
+    result = page(*args)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return result.content if isinstance(result, Shell) else result
+
+
+def main(iterations: int = 2000) -> None:
+    print(f"{'page':<12}{'full tree':>14}{'template':>14}{'speedup':>10}")
+    # The page builders only reference the backend from htmx callbacks
+    pages = (("home", home_page, ()), ("tasks", tasks_page, (None,)))
+    for name, page, args in pages:
+        content = _content(page, *args)
+        full = timeit.timeit(
+            lambda: to_xml(_shell_tree(content), indent=fh_cfg.indent).encode(),
+            number=iterations,
+        )
+        spliced = timeit.timeit(lambda: Shell(content).render(), number=iterations)
+        print(
+            f"{name:<12}{full / iterations * 1e6:>11.1f} us"
+            f"{spliced / iterations * 1e6:>11.1f} us{full / spliced:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -96,6 +96,10 @@ def mock_backend():
     # Health
     mock.health_check.return_value = SAMPLE_HEALTH.copy()
 
+    # Diagnostics
+    mock.stats.return_value = {}
+    mock.circuit_state.return_value = {"state": "closed", "consecutive_failures": 0}
+
     return mock
 
 
@@ -112,3 +116,44 @@ async def client(mock_backend):
         yield ac
 
     app_module.backend = original_backend
+
+
+# ── i18n usage report ────────────────────────────────────────────────
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--i18n-telemetry",
+        action="store_true",
+        help="count t() lookups, misses and interpolation failures and "
+             "print them after the run",
+    )
+
+
+def pytest_configure(config):
+    """Count t() traffic for the whole run when --i18n-telemetry is given."""
+    if config.getoption("i18n_telemetry"):
+        from app.i18n import enable_telemetry
+        enable_telemetry()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the hottest keys and every miss/interpolation failure."""
+    if not config.getoption("i18n_telemetry"):
+        return
+    from app.i18n import telemetry
+    counters = telemetry()
+    if counters is None or not counters.lookups:
+        return
+    stats = counters.stats(top=10)
+    tr = terminalreporter
+    tr.section("i18n telemetry")
+    tr.line(f"{stats['lookups']} lookups of {stats['distinct_keys']} keys")
+    tr.line("hottest keys:")
+    for key, count in stats["hot_keys"].items():
+        tr.line(f"  {count:>6}  {key}")
+    for title, per_lang in (
+        ("misses", stats["misses"]),
+        ("interpolation failures", stats["interpolation_failures"]),
+    ):
+        for lang, keys in per_lang.items():
+            tr.line(f"{title} [{lang}]: " + ", ".join(sorted(keys)))
@@ -0,0 +1,46 @@
+"""Local stand-in for the FridAI backend that honours HTTP validators.
+
+Serves /api/config, /api/categories and /api/tags with strong ETags and
+Last-Modified headers, answering conditional requests with 304. Counts
+full and not-modified responses so tests can assert on bandwidth saved.
+"""
+
+import hashlib
+import json
+from email.utils import formatdate
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+
+class StubBackend:
+    def __init__(self):
+        self.data = {
+            "/api/config": {"timezone": "UTC", "language": "en"},
+            "/api/categories": [{"id": 1, "name": "Work"}],
+            "/api/tags": [{"id": 1, "name": "urgent"}],
+        }
+        self.modified = {path: 1_700_000_000 for path in self.data}
+        self.full_responses = 0
+        self.not_modified = 0
+        self.app = Starlette(routes=[
+            Route(path, self._serve) for path in self.data
+        ])
+
+    def update(self, path, value):
+        self.data[path] = value
+        self.modified[path] += 60
+
+    def _serve(self, request: Request) -> Response:
+        path = request.url.path
+        body = json.dumps(self.data[path]).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        last_modified = formatdate(self.modified[path], usegmt=True)
+        headers = {"ETag": etag, "Last-Modified": last_modified}
+        if request.headers.get("if-none-match") == etag:
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        self.full_responses += 1
+        return Response(body, media_type="application/json", headers=headers)
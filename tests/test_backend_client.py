@@ -150,3 +150,408 @@ async def test_connect_error_raises_unavailable(bc):
     respx.get(f"{BASE}/api/tasks").mock(side_effect=Exception("connection refused"))
     with pytest.raises(Exception):
         await bc.get_tasks()
+
+
+# ── Reference-data cache ─────────────────────────────────────────────
+
+@pytest.fixture
+def cached_bc():
+    return BackendClient(BASE, reference_ttl=60.0, reference_stale_ttl=60.0)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_categories_served_from_cache(cached_bc):
+    route = respx.get(f"{BASE}/api/categories").mock(
+        return_value=Response(200, json=[{"id": 1, "name": "Work"}])
+    )
+    first = await cached_bc.get_categories()
+    second = await cached_bc.get_categories()
+    assert first == second == [{"id": 1, "name": "Work"}]
+    assert route.call_count == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default(bc):
+    route = respx.get(f"{BASE}/api/tags").mock(return_value=Response(200, json=[]))
+    await bc.get_tags()
+    await bc.get_tags()
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_create_category_invalidates_cache(cached_bc):
+    route = respx.get(f"{BASE}/api/categories").mock(
+        return_value=Response(200, json=[])
+    )
+    respx.post(f"{BASE}/api/categories").mock(
+        return_value=Response(201, json={"id": 2, "name": "Home"})
+    )
+    await cached_bc.get_categories()
+    await cached_bc.create_category({"name": "Home"})
+    await cached_bc.get_categories()
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_delete_tag_invalidates_cache(cached_bc):
+    route = respx.get(f"{BASE}/api/tags").mock(return_value=Response(200, json=[]))
+    respx.delete(f"{BASE}/api/tags/1").mock(
+        return_value=Response(200, json={"message": "deleted"})
+    )
+    await cached_bc.get_tags()
+    await cached_bc.delete_tag("1")
+    await cached_bc.get_tags()
+    assert route.call_count == 2
+
+
+# ── Request coalescing ───────────────────────────────────────────────
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_are_coalesced(bc):
+    import asyncio
+
+    async def slow(request):
+        await asyncio.sleep(0.01)
+        return Response(200, json=[{"id": 1, "name": "urgent"}])
+
+    route = respx.get(f"{BASE}/api/tags").mock(side_effect=slow)
+    results = await asyncio.gather(*(bc.get_tags() for _ in range(5)))
+    assert all(r == [{"id": 1, "name": "urgent"}] for r in results)
+    assert route.call_count == 1
+    stats = bc.stats()["single_flight"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 4
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_different_params_are_not_coalesced(bc):
+    import asyncio
+    route = respx.get(f"{BASE}/api/tasks").mock(return_value=Response(200, json=[]))
+    await asyncio.gather(bc.get_tasks(status="pending"), bc.get_tasks(status="completed"))
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_writes_are_never_coalesced(bc):
+    import asyncio
+    route = respx.post(f"{BASE}/api/tasks").mock(
+        return_value=Response(201, json={"id": 1})
+    )
+    await asyncio.gather(bc.create_task({"title": "a"}), bc.create_task({"title": "a"}))
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_coalesced_error_reaches_every_waiter(bc):
+    import asyncio
+    respx.get(f"{BASE}/api/tags").mock(return_value=Response(500, text="boom"))
+    results = await asyncio.gather(bc.get_tags(), bc.get_tags(), return_exceptions=True)
+    assert all(isinstance(r, BackendAPIError) for r in results)
+
+
+# ── Connection pool configuration ────────────────────────────────────
+
+def test_pool_limits_and_timeouts_are_configurable():
+    import httpx
+    bc = BackendClient(
+        BASE,
+        limits=httpx.Limits(max_connections=7, max_keepalive_connections=3,
+                            keepalive_expiry=12.0),
+        timeout=httpx.Timeout(connect=1.0, read=2.0, write=3.0, pool=4.0),
+    )
+    assert bc.client.timeout.connect == 1.0
+    assert bc.client.timeout.read == 2.0
+    assert bc.client.timeout.pool == 4.0
+    pool = bc.stats()["pool"]
+    assert pool["max_connections"] == 7
+    assert pool["max_keepalive_connections"] == 3
+    assert pool["keepalive_expiry"] == 12.0
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    import importlib.util
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util, "find_spec",
+        lambda name, *a: None if name == "h2" else real_find_spec(name, *a),
+    )
+    bc = BackendClient(BASE, http2=True)
+    assert bc.http2 is False
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_pool_timeout_is_reported(bc):
+    import httpx
+    respx.get(f"{BASE}/api/tasks").mock(side_effect=httpx.PoolTimeout("full"))
+    with pytest.raises(BackendUnavailableError, match="pool exhausted"):
+        await bc.get_tasks()
+    assert bc.stats()["pool"]["pool_timeouts"] == 1
+    assert bc.stats()["pool"]["in_flight"] == 0
+
+
+# ── Circuit breaker ──────────────────────────────────────────────────
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_circuit_opens_and_fails_fast():
+    import httpx
+    from app.utils.backend import CircuitOpenError
+    bc = BackendClient(BASE, breaker_threshold=2, breaker_reset_timeout=60)
+    route = respx.get(f"{BASE}/api/tasks").mock(
+        side_effect=httpx.ConnectError("refused")
+    )
+    for _ in range(2):
+        with pytest.raises(BackendUnavailableError):
+            await bc.get_tasks()
+    with pytest.raises(CircuitOpenError):
+        await bc.get_tasks()
+    assert route.call_count == 2
+    assert bc.circuit_state()["state"] == "open"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip_breaker():
+    bc = BackendClient(BASE, breaker_threshold=1)
+    respx.get(f"{BASE}/api/tasks").mock(return_value=Response(404, text="nope"))
+    for _ in range(3):
+        with pytest.raises(BackendAPIError):
+            await bc.get_tasks()
+    assert bc.circuit_state()["state"] == "closed"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_server_errors_trip_breaker():
+    bc = BackendClient(BASE, breaker_threshold=1, breaker_reset_timeout=60)
+    respx.get(f"{BASE}/api/tasks").mock(return_value=Response(503, text="busy"))
+    with pytest.raises(BackendAPIError):
+        await bc.get_tasks()
+    assert bc.circuit_state()["state"] == "open"
+
+
+# ── Retries and hedging ──────────────────────────────────────────────
+
+def _retrying_client(**kwargs):
+    from app.utils.resilience import RetryPolicy
+    return BackendClient(
+        BASE,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0, max_delay=0),
+        **kwargs,
+    )
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_idempotent_get_is_retried():
+    import httpx
+    bc = _retrying_client()
+    route = respx.get(f"{BASE}/api/tasks").mock(side_effect=[
+        httpx.ConnectError("reset"),
+        Response(200, json=[{"id": 1}]),
+    ])
+    assert await bc.get_tasks() == [{"id": 1}]
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_post_is_not_retried():
+    import httpx
+    bc = _retrying_client()
+    route = respx.post(f"{BASE}/api/tasks").mock(side_effect=httpx.ConnectError("reset"))
+    with pytest.raises(BackendUnavailableError):
+        await bc.create_task({"title": "x"})
+    assert route.call_count == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_forced_delete_is_retried_and_404_after_retry_is_success():
+    import httpx
+    bc = _retrying_client()
+    route = respx.delete(f"{BASE}/api/tasks/1").mock(side_effect=[
+        httpx.ReadTimeout("lost"),
+        Response(404, text="gone"),
+    ])
+    assert await bc.delete_task("1", force=True) is None
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    bc = _retrying_client()
+    route = respx.get(f"{BASE}/api/tasks").mock(return_value=Response(400, text="bad"))
+    with pytest.raises(BackendAPIError):
+        await bc.get_tasks()
+    assert route.call_count == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_slow_read_is_hedged():
+    import asyncio
+    bc = BackendClient(BASE, hedge=True)
+    for _ in range(bc.latency.min_samples):
+        bc.latency.record(0.01, "/api/tasks/overdue")
+    calls = {"n": 0}
+
+    async def responder(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            await asyncio.sleep(1)
+        return Response(200, json=[{"id": calls["n"]}])
+
+    respx.get(f"{BASE}/api/tasks/overdue").mock(side_effect=responder)
+    result = await bc.get_overdue_tasks()
+    assert result == [{"id": 2}]
+    assert bc.stats()["retry"]["hedged"] == 1
+
+
+# ── Pagination ───────────────────────────────────────────────────────
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_tasks_passes_limit_and_offset(bc):
+    respx.get(f"{BASE}/api/tasks").mock(return_value=Response(200, json=[]))
+    await bc.get_tasks(status="completed", limit=5, offset=10)
+    url = str(respx.calls[0].request.url)
+    assert "limit=5" in url
+    assert "offset=10" in url
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_task_pages_walks_until_short_page(bc):
+    tasks = [{"id": i} for i in range(5)]
+
+    def page(request):
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        return Response(200, json=tasks[offset:offset + limit])
+
+    route = respx.get(f"{BASE}/api/tasks").mock(side_effect=page)
+    pages = [p async for p in bc.iter_task_pages(page_size=2, status="pending")]
+    assert pages == [tasks[0:2], tasks[2:4], tasks[4:5]]
+    assert route.call_count == 3
+    assert "status=pending" in str(route.calls[0].request.url)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_health_checks_do_not_feed_hedge_delay():
+    bc = BackendClient(BASE, hedge=True)
+    respx.get(f"{BASE}/healthz").mock(return_value=Response(200, json={"status": "ok"}))
+    respx.get(f"{BASE}/api/tasks/overdue").mock(return_value=Response(200, json=[]))
+    for _ in range(bc.latency.min_samples):
+        await bc.health_check()
+    assert bc.latency.percentile(0.95, "/healthz") is None
+    await bc.get_overdue_tasks()
+    assert bc.latency.percentile(0.95, "/api/tasks/overdue") is None
+    assert len(bc.latency._samples["/api/tasks/overdue"]) == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_coalesced_callers_keep_their_own_deadlines(bc):
+    import asyncio
+    from app.utils.backend import DeadlineExceededError
+    from app.utils.deadline import deadline_scope
+
+    timeouts = []
+
+    async def slow(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        await asyncio.sleep(0.2)
+        return Response(200, json=[{"id": 1}])
+
+    respx.get(f"{BASE}/api/tags").mock(side_effect=slow)
+
+    async def call(seconds):
+        with deadline_scope(seconds):
+            return await bc.get_tags()
+
+    patient = asyncio.ensure_future(call(10))
+    await asyncio.sleep(0)  # the long-deadline caller starts the shared call
+    impatient = asyncio.ensure_future(call(0.05))
+    with pytest.raises(DeadlineExceededError):
+        await impatient
+    assert await patient == [{"id": 1}]
+    assert len(timeouts) == 1 and timeouts[0] > 1
+    assert bc.stats()["single_flight"]["hits"] == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_later_waiter_extends_coalesced_deadline(bc):
+    import asyncio
+    from app.utils.backend import DeadlineExceededError
+    from app.utils.deadline import deadline_scope
+
+    timeouts = []
+
+    async def slow(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        await asyncio.sleep(0.2)
+        return Response(200, json=[{"id": 1}])
+
+    respx.get(f"{BASE}/api/tags").mock(side_effect=slow)
+
+    async def call(seconds):
+        with deadline_scope(seconds):
+            return await bc.get_tags()
+
+    impatient = asyncio.ensure_future(call(0.05))
+    await asyncio.sleep(0)  # the short-deadline caller starts the shared call
+    patient = asyncio.ensure_future(call(10))
+    with pytest.raises(DeadlineExceededError):
+        await impatient
+    assert await patient == [{"id": 1}]
+    # Cut at the first caller's deadline, then sent again with the longer one
+    assert len(timeouts) == 2
+    assert timeouts[0] <= 0.05 < 1 < timeouts[1]
+    assert bc.circuit_state()["state"] == "closed"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_task_pages_stops_when_offset_is_ignored(bc):
+    tasks = [{"id": i} for i in range(2)]
+    route = respx.get(f"{BASE}/api/tasks").mock(return_value=Response(200, json=tasks))
+    pages = [p async for p in bc.iter_task_pages(page_size=2)]
+    assert pages == [tasks]
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_task_pages_stops_when_limit_is_ignored(bc):
+    tasks = [{"id": i} for i in range(5)]
+    route = respx.get(f"{BASE}/api/tasks").mock(return_value=Response(200, json=tasks))
+    pages = [p async for p in bc.iter_task_pages(page_size=2)]
+    assert pages == [tasks]
+    assert route.call_count == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_task_pages_is_capped(bc):
+    counter = iter(range(10**6))
+
+    def endless(request):
+        return Response(200, json=[{"id": next(counter)}, {"id": next(counter)}])
+
+    route = respx.get(f"{BASE}/api/tasks").mock(side_effect=endless)
+    pages = [p async for p in bc.iter_task_pages(page_size=2, max_pages=3)]
+    assert len(pages) == 3
+    assert route.call_count == 3
@@ -0,0 +1,119 @@
+"""Tests for the TTL / stale-while-revalidate cache."""
+
+import asyncio
+
+import pytest
+
+from app.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_loader():
+    calls = {"n": 0}
+
+    async def loader():
+        calls["n"] += 1
+        return calls["n"]
+
+    return loader, calls
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_from_cache():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    loader, calls = _counting_loader()
+    assert await cache.get("k", loader) == 1
+    clock.now = 5
+    assert await cache.get("k", loader) == 1
+    assert calls["n"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_while_refreshing():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, stale_ttl=20, clock=clock)
+    loader, calls = _counting_loader()
+    await cache.get("k", loader)
+    clock.now = 15
+    # Stale value comes back immediately, refresh runs in the background
+    assert await cache.get("k", loader) == 1
+    await asyncio.sleep(0)
+    assert calls["n"] == 2
+    assert await cache.get("k", loader) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_reloads_inline():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, stale_ttl=20, clock=clock)
+    loader, calls = _counting_loader()
+    await cache.get("k", loader)
+    clock.now = 31
+    assert await cache.get("k", loader) == 2
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_discards_in_flight_load():
+    cache = TTLCache(ttl=10)
+    release = asyncio.Event()
+
+    async def slow_loader():
+        await release.wait()
+        return "old"
+
+    pending = asyncio.ensure_future(cache.get("k", slow_loader))
+    await asyncio.sleep(0)
+    cache.invalidate("k")
+    release.set()
+    assert await pending == "old"
+
+    async def fresh_loader():
+        return "new"
+
+    assert await cache.get("k", fresh_loader) == "new"
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_cache():
+    cache = TTLCache(ttl=0)
+    loader, calls = _counting_loader()
+    await cache.get("k", loader)
+    await cache.get("k", loader)
+    assert calls["n"] == 2
+
+
+# ── LRU cache ────────────────────────────────────────────────────────
+
+from app.utils.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_respects_byte_budget():
+    cache = LRUCache(max_entries=100, max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "yyyy")
+    cache.put("c", "zzzz")
+    assert len(cache) == 2
+    assert cache.stats()["bytes"] == 8
+    cache.put("huge", "x" * 11)
+    assert cache.get("huge") is None
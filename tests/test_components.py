@@ -1,14 +1,28 @@
-"""Tests for UI components — task_card, error_message, success_message, nav."""
+"""Tests for UI components — task_card, error_message, success_message, nav, shell."""
+
+import re
 
 import pytest
+from fasthtml import ft
 from fasthtml.common import to_xml
 
-from app.utils.components import task_card, error_message, success_message, nav
+from app.i18n import set_language
+from app.utils.serializer import fast_xml
+from app.utils.components import (
+    task_card, error_message, success_message, nav,
+    shell, _shell_tree, _shell_template,
+    cached_task_card, task_card_cache,
+)
 
 
 def _render(element) -> str:
-    """Render a FastHTML element to an HTML string."""
-    return to_xml(element)
+    """Render a FastHTML element to an HTML string.
+
+    Every render also checks that the fast-path serializer is byte-identical.
+    """
+    html = to_xml(element)
+    assert fast_xml(element) == html
+    return html
 
 
 class TestTaskCard:
@@ -119,3 +133,90 @@ class TestNav:
         assert "Categories" in html
         assert "Tags" in html
         assert "Settings" in html
+
+
+class TestShell:
+    @staticmethod
+    def _squash(html: str) -> str:
+        return re.sub(r"\s+", "", html)
+
+    def test_splice_matches_full_render(self):
+        content = ft.Div(ft.H1("Hello & <welcome>"), ft.P("body"))
+        spliced = shell(content).render().decode()
+        full = _render(_shell_tree(content))
+        # Only indentation may differ between the two
+        assert self._squash(spliced) == self._squash(full)
+        assert "Hello &amp; &lt;welcome&gt;" in spliced
+
+    def test_template_rendered_once_per_language(self):
+        set_language("en")
+        assert _shell_template() is _shell_template()
+
+    def test_set_language_invalidates_template(self):
+        set_language("en")
+        english = _shell_template()
+        try:
+            set_language("es")
+            assert _shell_template() != english
+        finally:
+            set_language("en")
+        assert _shell_template() == english
+
+    @pytest.mark.asyncio
+    async def test_streaming_flushes_skeleton_before_sections(self):
+        import asyncio
+        from app.utils.components import StreamingShell
+
+        release = asyncio.Event()
+
+        async def section():
+            await release.wait()
+            return ft.P("late data")
+
+        page = StreamingShell(
+            ft.Div("skeleton", id="slot"), {"slot": section}, budget=1.0
+        )
+        chunks = page.stream()
+        first = await chunks.__anext__()
+        assert b"skeleton" in first and b"theme-toggle" in first
+        assert b"late data" not in first
+
+        release.set()
+        rest = b"".join([chunk async for chunk in chunks])
+        assert b'<template id="fill-slot"><p>late data</p>' in rest
+        assert rest.rstrip().endswith(b"</html>")
+
+
+class TestCachedTaskCard:
+    TASK = {"id": 7, "title": "Cached", "status": "pending",
+            "due_at": "2026-03-01T12:00:00", "category_id": 1, "tag_ids": [1]}
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        task_card_cache.clear()
+        yield
+        task_card_cache.clear()
+
+    def test_matches_uncached_render(self):
+        cached = cached_task_card(self.TASK, {1: "Work"}, {1: "urgent"})
+        assert str(cached) == to_xml(task_card(self.TASK, {1: "Work"}, {1: "urgent"}))
+
+    def test_reuses_html_for_unchanged_task(self):
+        cached_task_card(self.TASK, {1: "Work"}, {1: "urgent"})
+        cached_task_card(dict(self.TASK), {1: "Work"}, {1: "urgent"})
+        assert task_card_cache.hits == 1
+        assert len(task_card_cache) == 1
+
+    def test_content_or_name_changes_miss(self):
+        cached_task_card(self.TASK, {1: "Work"}, {1: "urgent"})
+        edited = cached_task_card({**self.TASK, "title": "Edited"}, {1: "Work"}, {1: "urgent"})
+        renamed = cached_task_card(self.TASK, {1: "Work"}, {1: "later"})
+        assert "Edited" in edited
+        assert "later" in renamed
+        assert len(task_card_cache) == 3
+
+    def test_language_reload_clears_cache(self):
+        from app.i18n import reload
+        cached_task_card(self.TASK)
+        reload()
+        assert len(task_card_cache) == 0
@@ -0,0 +1,150 @@
+"""Tests for the response compression middleware."""
+
+import gzip
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.utils.compression import CPUBudget, CompressionMiddleware, accepted_encodings
+
+PAGE = "<div class='task-item'>" + "<p>hello world</p>" * 200 + "</div>"
+
+
+async def _page(request):
+    return HTMLResponse(PAGE, headers={"ETag": '"abc"'})
+
+
+async def _tiny(request):
+    return HTMLResponse("<p>hi</p>")
+
+
+async def _encoded(request):
+    return Response(gzip.compress(PAGE.encode()), media_type="text/html",
+                    headers={"Content-Encoding": "gzip"})
+
+
+async def _png(request):
+    return Response(b"\x89PNG" * 500, media_type="image/png")
+
+
+async def _stream(request):
+    async def chunks():
+        yield b"<p>first</p>" * 10
+        yield b"<p>second</p>" * 10
+    return StreamingResponse(chunks(), media_type="text/html")
+
+
+def _app(**kwargs):
+    app = Starlette(routes=[
+        Route("/page", _page), Route("/tiny", _tiny), Route("/encoded", _encoded),
+        Route("/png", _png), Route("/stream", _stream),
+    ])
+    return CompressionMiddleware(app, **kwargs)
+
+
+def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def _raw(app, path, encoding):
+    """Fetch ``path`` and return (response, undecoded body)."""
+    async with _client(app) as client:
+        async with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as resp:
+            body = b"".join([chunk async for chunk in resp.aiter_raw()])
+    return resp, body
+
+
+def test_accepted_encodings_honours_q_zero():
+    assert accepted_encodings("gzip;q=0, br, zstd;q=0.5") == {"br", "zstd"}
+
+
+@pytest.mark.asyncio
+async def test_gzip_page_with_headers():
+    resp, body = await _raw(_app(), "/page", "gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert resp.headers["etag"] == 'W/"abc"'
+    assert int(resp.headers["content-length"]) == len(body)
+    assert gzip.decompress(body).decode() == PAGE
+
+
+@pytest.mark.asyncio
+async def test_prefers_zstd_then_brotli():
+    zstandard = pytest.importorskip("zstandard")
+    resp, body = await _raw(_app(), "/page", "gzip, br, zstd")
+    assert resp.headers["content-encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(body).decode() == PAGE
+
+
+@pytest.mark.asyncio
+async def test_brotli_when_zstd_not_accepted():
+    brotli = pytest.importorskip("brotli")
+    resp, body = await _raw(_app(), "/page", "gzip, br")
+    assert resp.headers["content-encoding"] == "br"
+    assert brotli.decompress(body).decode() == PAGE
+
+
+@pytest.mark.asyncio
+async def test_skips_small_bodies_and_unlisted_types():
+    for path in ("/tiny", "/png"):
+        resp, _ = await _raw(_app(), path, "gzip")
+        assert "content-encoding" not in resp.headers, path
+
+
+@pytest.mark.asyncio
+async def test_already_encoded_body_passes_through():
+    resp, body = await _raw(_app(), "/encoded", "br, gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == PAGE
+
+
+@pytest.mark.asyncio
+async def test_no_compression_without_accept_encoding():
+    resp, body = await _raw(_app(), "/page", "identity")
+    assert "content-encoding" not in resp.headers
+    assert body.decode() == PAGE
+
+
+@pytest.mark.asyncio
+async def test_streamed_chunks_are_flushed_individually():
+    resp, body = await _raw(_app(minimum_size=10_000), "/stream", "gzip")
+    # Streams are compressed regardless of the single-message size threshold
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "content-length" not in resp.headers
+    assert gzip.decompress(body) == b"<p>first</p>" * 10 + b"<p>second</p>" * 10
+
+
+@pytest.mark.asyncio
+async def test_per_type_level_override():
+    resp, body = await _raw(_app(levels={"text/html": {"gzip": 1}}), "/page", "gzip")
+    fast = len(body)
+    resp, body = await _raw(_app(levels={"text/html": {"gzip": 9}}), "/page", "gzip")
+    assert len(body) <= fast
+
+
+@pytest.mark.asyncio
+async def test_cpu_budget_exhaustion_sends_identity():
+    app = _app()
+    app.budget.charge(10.0)
+    resp, body = await _raw(app, "/page", "gzip")
+    assert "content-encoding" not in resp.headers
+    assert app.budget.exhausted == 1
+
+
+def test_cpu_budget_window_rolls_over():
+    now = [0.0]
+    budget = CPUBudget(0.5, window=1.0, clock=lambda: now[0])
+    budget.charge(0.6)
+    assert not budget.allow()
+    now[0] = 1.5
+    assert budget.allow()
+
+
+@pytest.mark.asyncio
+async def test_app_pages_are_compressed(client):
+    resp = await client.get("/app", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "Task Manager" in resp.text or "<html" in resp.text
@@ -0,0 +1,56 @@
+"""Conditional GETs between BackendClient and a validator-aware backend."""
+
+import httpx
+import pytest
+
+from app.utils.backend import BackendClient
+from tests.stub_backend import StubBackend
+
+
+@pytest.fixture
+def stub():
+    return StubBackend()
+
+
+@pytest.fixture
+def bc(stub):
+    return BackendClient(
+        "http://stub", transport=httpx.ASGITransport(app=stub.app)
+    )
+
+
+@pytest.mark.asyncio
+async def test_unchanged_resource_is_revalidated_not_redownloaded(stub, bc):
+    first = await bc.get_settings()
+    second = await bc.get_settings()
+    assert first == second == {"timezone": "UTC", "language": "en"}
+    # The decoded object is reused as-is on a 304
+    assert second is first
+    assert stub.full_responses == 1
+    assert stub.not_modified == 1
+    assert bc.stats()["conditional"]["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_resource_is_downloaded_again(stub, bc):
+    await bc.get_tags()
+    stub.update("/api/tags", [{"id": 1, "name": "urgent"}, {"id": 2, "name": "home"}])
+    tags = await bc.get_tags()
+    assert [tg["name"] for tg in tags] == ["urgent", "home"]
+    assert stub.full_responses == 2
+    assert stub.not_modified == 0
+
+
+@pytest.mark.asyncio
+async def test_validators_are_sent(stub, bc):
+    seen = []
+
+    async def spy(request):
+        seen.append(dict(request.headers))
+
+    bc.client.event_hooks["request"].append(spy)
+    await bc.get_categories()
+    await bc.get_categories()
+    assert "if-none-match" not in seen[0]
+    assert seen[1]["if-none-match"].startswith('"')
+    assert "if-modified-since" in seen[1]
@@ -0,0 +1,109 @@
+"""Tests for per-request deadlines and their propagation to backend calls."""
+
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from app.utils import deadline
+from app.utils.backend import BackendClient, DeadlineExceededError
+
+BASE = "http://test-backend"
+
+
+def test_no_deadline_outside_scope():
+    assert deadline.remaining() is None
+    assert deadline.clamp(5.0) == 5.0
+
+
+def test_scope_clamps_timeouts():
+    with deadline.deadline_scope(1.0):
+        assert 0 < deadline.remaining() <= 1.0
+        assert deadline.clamp(5.0) <= 1.0
+        assert deadline.clamp(0.5) == 0.5
+    assert deadline.remaining() is None
+
+
+def test_nested_scope_cannot_extend_outer():
+    with deadline.deadline_scope(0.5):
+        with deadline.deadline_scope(10.0):
+            assert deadline.remaining() <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_middleware_honours_shorter_client_header():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["left"] = deadline.remaining()
+
+    mw = deadline.DeadlineMiddleware(app, default=10.0)
+    await mw({"type": "http", "headers": [(b"x-request-timeout", b"2")]}, None, None)
+    assert seen["left"] <= 2.0
+    await mw({"type": "http", "headers": [(b"x-request-timeout", b"60")]}, None, None)
+    assert 2.0 < seen["left"] <= 10.0
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_expired_deadline_skips_network_call():
+    bc = BackendClient(BASE, breaker_threshold=1)
+    route = respx.get(f"{BASE}/api/tasks").mock(return_value=Response(200, json=[]))
+    with deadline.deadline_scope(0):
+        with pytest.raises(DeadlineExceededError):
+            await bc.get_tasks()
+    assert route.call_count == 0
+    # Running out of budget is not the backend's fault
+    assert bc.circuit_state()["state"] == "closed"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_slow_call_is_cut_at_deadline():
+    bc = BackendClient(BASE)
+
+    async def slow(request):
+        await asyncio.sleep(5)
+        return Response(200, json=[])
+
+    respx.get(f"{BASE}/api/tasks").mock(side_effect=slow)
+    with deadline.deadline_scope(0.05):
+        with pytest.raises(DeadlineExceededError):
+            await bc.get_tasks()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_coalesced_get_is_clamped_and_cancelled_with_its_caller():
+    bc = BackendClient(BASE)
+    sent, finished = [], []
+
+    async def slow(request):
+        sent.append(request.extensions["timeout"])
+        await asyncio.sleep(1)
+        finished.append(request)
+        return Response(200, json=[])
+
+    respx.get(f"{BASE}/api/tasks").mock(side_effect=slow)
+    with deadline.deadline_scope(0.1):
+        with pytest.raises(DeadlineExceededError):
+            await bc.get_tasks()
+    assert len(sent) == 1
+    assert all(0 < t <= 0.1 for t in sent[0].values())
+    await asyncio.sleep(0)
+    # The last waiter left, so the upstream call did not run on
+    assert bc.stats()["single_flight"]["in_flight"] == 0
+    assert bc.in_flight == 0
+    assert finished == []
+
+
+@pytest.mark.asyncio
+async def test_lookup_failure_renders_partial_task_list(client, mock_backend):
+    """Tasks still render (with #id fallbacks) when lookups run out of time."""
+    mock_backend.get_categories.side_effect = DeadlineExceededError("late")
+    mock_backend.get_tags.side_effect = DeadlineExceededError("late")
+    resp = await client.get("/app/all/tasks")
+    assert resp.status_code == 200
+    assert "Test task" in resp.text
+    assert "#1" in resp.text
@@ -35,3 +35,48 @@ async def test_healthz_degraded(client, mock_backend):
     data = resp.json()
     assert data["status"] == "degraded"
     assert data["checks"]["backend"]["status"] == "down"
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_backend_counters(client, mock_backend):
+    """GET /metrics returns the backend client's counters as JSON."""
+    mock_backend.stats.return_value = {"single_flight": {"hits": 3, "misses": 1}}
+    resp = await client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.json()["backend"]["single_flight"]["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_healthz_reports_circuit_state(client, mock_backend):
+    """GET /healthz includes the backend circuit breaker state."""
+    from app.utils.backend import CircuitOpenError
+    mock_backend.health_check.side_effect = CircuitOpenError("circuit open")
+    mock_backend.circuit_state.return_value = {"state": "open", "consecutive_failures": 5}
+
+    resp = await client.get("/healthz")
+    assert resp.status_code == 503
+    assert resp.json()["checks"]["backend"]["circuit"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_fragment_cache(client):
+    """GET /metrics includes the task card fragment cache counters."""
+    resp = await client.get("/metrics")
+    stats = resp.json()["fragments"]["task_card"]
+    assert {"entries", "hits", "misses", "evictions", "bytes"} <= stats.keys()
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_i18n_telemetry(client, monkeypatch):
+    """GET /metrics includes i18n counters when telemetry is on."""
+    from app.i18n import loader
+    monkeypatch.setattr(loader, "_TELEMETRY", loader.Telemetry())
+    loader.t("nav.home")
+    loader.t("no.such.key")
+    stats = (await client.get("/metrics")).json()["i18n"]
+    assert stats["enabled"] is True
+    assert stats["hot_keys"]["nav.home"] >= 1
+    assert stats["misses"]["en"]["no.such.key"] == 1
+
+    monkeypatch.setattr(loader, "_TELEMETRY", None)
+    assert (await client.get("/metrics")).json()["i18n"] == {"enabled": False}
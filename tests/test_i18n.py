@@ -88,6 +88,19 @@ class TestLanguageSwitching:
         assert get_language() == "en"
         assert t("nav.home") == "Home"
 
+    def test_default_language_applies_without_a_current_one(self):
+        from app.i18n import set_default_language
+        from app.i18n.loader import _CURRENT
+        token = _CURRENT.set(None)
+        try:
+            set_default_language("es")
+            assert get_language() == "es"
+            set_language("en")  # current-request choice wins over the default
+            assert get_language() == "en"
+        finally:
+            set_default_language("en")
+            _CURRENT.reset(token)
+
     def test_available_languages(self):
         langs = available_languages()
         assert isinstance(langs, list)
@@ -99,3 +112,271 @@ class TestLanguageSwitching:
         lang_dict = dict(langs)
         assert lang_dict["en"] == "English"
         assert lang_dict["es"] == "Español"
+
+
+class TestCompiledCatalog:
+    def test_every_leaf_is_compiled(self):
+        from app.i18n import loader
+        set_language("en")
+
+        def leaves(d, prefix=""):
+            for k, v in d.items():
+                path = f"{prefix}{k}"
+                if isinstance(v, dict):
+                    yield from leaves(v, f"{path}.")
+                else:
+                    yield path, v
+        catalog = loader._REGISTRY["en"]
+        for path, value in leaves(catalog.strings):
+            assert catalog.entries[path].raw == str(value)
+
+    def test_simple_template_is_preparsed(self):
+        from app.i18n.loader import _Entry
+        entry = _Entry("Hi {name}, {count} left")
+        assert entry.parts == ("Hi ", "name", ", ", "count", " left")
+        assert entry.format({"name": "Ana", "count": 3}) == "Hi Ana, 3 left"
+
+    def test_plain_string_is_not_templated(self):
+        from app.i18n.loader import _Entry
+        assert not _Entry("Home").templated
+
+    @pytest.mark.parametrize("raw", [
+        "{0} items", "{} items", "{n:>3}", "{n!r}", "{user.name}", "{xs[0]}",
+    ])
+    def test_complex_fields_match_str_format(self, raw):
+        from app.i18n.loader import _Entry
+        entry = _Entry(raw)
+        assert entry.parts is None
+        kwargs = {"n": 7, "user": type("U", (), {"name": "Ana"}), "xs": ["a"]}
+        try:
+            expected = raw.format(**kwargs)
+        except (KeyError, IndexError) as e:
+            with pytest.raises(type(e)):
+                entry.format(kwargs)
+        else:
+            assert entry.format(kwargs) == expected
+
+    def test_escaped_braces(self):
+        from app.i18n.loader import _Entry
+        entry = _Entry("{{literal}} {name}")
+        assert entry.format({"name": "x"}) == "{literal} x"
+        assert entry.raw == "{{literal}} {name}"
+
+    def test_section_key_keeps_uncompiled_behaviour(self):
+        set_language("en")
+        assert t("nav").startswith("{")
+
+
+class TestNegotiation:
+    def test_cookie_wins(self):
+        from app.i18n.loader import negotiate
+        assert negotiate("es", "en-US,en;q=0.9") == "es"
+
+    def test_unknown_cookie_falls_through(self):
+        from app.i18n.loader import negotiate
+        assert negotiate("xx", "es-CL,es;q=0.9") == "es"
+
+    def test_accept_language_quality_order(self):
+        from app.i18n.loader import negotiate
+        assert negotiate(None, "fr;q=1, en;q=0.5, es;q=0.8") == "es"
+        assert negotiate(None, "es;q=0, en;q=0.1") == "en"
+
+    def test_no_match_uses_default(self):
+        from app.i18n.loader import negotiate
+        assert negotiate(None, "") is None
+        assert negotiate(None, "fr, *") is None
+
+    def test_set_language_does_not_touch_disk(self, monkeypatch):
+        from app.i18n import loader
+
+        def boom(*args, **kwargs):
+            raise AssertionError("file read during set_language")
+        monkeypatch.setattr(loader, "_load_strings", boom)
+        set_language("es")
+        set_language("en")
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """A private copy of the language files and their cache."""
+    from app.i18n import loader
+    for p in loader._DIR.glob("strings_*.yaml"):
+        (tmp_path / p.name).write_bytes(p.read_bytes())
+    monkeypatch.setattr(loader, "_DIR", tmp_path)
+    monkeypatch.setattr(loader, "_CACHE_PATH", tmp_path / "__pycache__" / "strings.marshal")
+    # install() swaps these; put the real ones back afterwards
+    for name in ("_REGISTRY", "_STRINGS", "_DEFAULT"):
+        monkeypatch.setattr(loader, name, getattr(loader, name))
+    parsed = []
+    real = loader._parse_yaml
+    monkeypatch.setattr(loader, "_parse_yaml", lambda data: parsed.append(1) or real(data))
+    return tmp_path, parsed
+
+
+class TestBinaryCache:
+    def test_second_load_skips_yaml(self, tree):
+        from app.i18n import loader
+        path, parsed = tree
+        first = loader._load_strings(use_cache=True)
+        assert (path / "__pycache__" / "strings.marshal").exists()
+        parsed.clear()
+        assert loader._load_strings(use_cache=True) == first
+        assert parsed == []
+
+    def test_touched_but_unchanged_file_reuses_cache(self, tree):
+        import os
+        from app.i18n import loader
+        path, parsed = tree
+        loader._load_strings(use_cache=True)
+        parsed.clear()
+        os.utime(path / "strings_es.yaml", ns=(0, 0))
+        loader._load_strings(use_cache=True)
+        assert parsed == []
+
+    def test_edited_file_is_reparsed(self, tree):
+        from app.i18n import loader
+        path, parsed = tree
+        loader._load_strings(use_cache=True)
+        parsed.clear()
+        f = path / "strings_es.yaml"
+        f.write_text(f.read_text(encoding="utf-8").replace("Inicio", "Portada"), encoding="utf-8")
+        strings = loader._load_strings(use_cache=True)
+        assert parsed == [1]
+        assert strings["es"]["nav"]["home"] == "Portada"
+
+    def test_corrupt_cache_is_ignored(self, tree):
+        from app.i18n import loader
+        path, parsed = tree
+        loader._load_strings(use_cache=True)
+        (path / "__pycache__" / "strings.marshal").write_bytes(b"garbage")
+        parsed.clear()
+        assert loader._load_strings(use_cache=True)["en"]["nav"]["home"] == "Home"
+        assert len(parsed) == 2
+
+    def test_available_languages_reads_no_files(self, tree):
+        path, _ = tree
+        for p in path.glob("strings_*.yaml"):
+            p.unlink()
+        assert ("es", "Español") in available_languages()
+
+
+def _edit(path, old, new):
+    f = path / "strings_es.yaml"
+    f.write_text(f.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+
+class TestHotReload:
+    def test_only_changed_catalog_is_replaced(self, tree):
+        from app.i18n import loader
+        path, parsed = tree
+        loader.install(loader._load_catalogs())
+        english, spanish = loader._REGISTRY["en"], loader._REGISTRY["es"]
+        parsed.clear()
+        _edit(path, "Inicio", "Portada")
+        assert loader.install(loader.build_registry()) == ["es"]
+        assert parsed == [1]
+        assert loader._REGISTRY["en"] is english
+        assert loader._REGISTRY["es"] is not spanish
+        set_language("es")
+        try:
+            assert t("nav.home") == "Portada"
+        finally:
+            set_language("en")
+
+    def test_unchanged_files_skip_hooks(self, tree, monkeypatch):
+        from app.i18n import loader
+        calls = []
+        monkeypatch.setattr(loader, "_RELOAD_HOOKS", [lambda: calls.append(1)])
+        assert loader.install(loader.build_registry()) == []
+        assert calls == []
+
+    def test_reload_clears_rendered_caches(self, tree):
+        from app.i18n import loader
+        from app.utils.components import _shell_template, _shell_templates
+        path, _ = tree
+        set_language("es")
+        try:
+            _shell_template()
+            assert "es" in _shell_templates
+            _edit(path, "Inicio", "Portada")
+            loader.install(loader.build_registry())
+            assert _shell_templates == {}
+            set_language("es")  # this context still holds the old catalog
+            assert b"Portada" in _shell_template()[0]
+        finally:
+            set_language("en")
+
+    @pytest.mark.asyncio
+    async def test_watcher_keeps_old_strings_on_bad_yaml(self, tree, monkeypatch):
+        from app.i18n import loader, watcher
+        path, _ = tree
+        good = loader._REGISTRY
+        target = str(path / "strings_es.yaml")
+
+        async def fake_awatch(directory, watch_filter, stop_event):
+            assert watch_filter(None, target)
+            assert not watch_filter(None, str(path / "notes.txt"))
+            (path / "strings_es.yaml").write_text("meta: [unclosed", encoding="utf-8")
+            yield {(2, target)}
+            _edit(path, "[unclosed", "{code: es, display_name: Espanol}\nnav: {home: Portada}")
+            yield {(2, target)}
+
+        monkeypatch.setattr(watcher, "awatch", fake_awatch)
+        seen = []
+        real_install = loader.install
+        monkeypatch.setattr(loader, "install", lambda r: seen.append(real_install(r)) or seen[-1])
+        await watcher.watch_strings()
+        assert seen == [["es"]]
+        assert loader._REGISTRY is not good
+        assert loader._REGISTRY["es"].strings["nav"]["home"] == "Portada"
+
+
+class TestTelemetry:
+    @pytest.fixture
+    def counters(self, monkeypatch):
+        from app.i18n import loader
+        monkeypatch.setattr(loader, "_TELEMETRY", loader.Telemetry())
+        set_language("en")
+        return loader._TELEMETRY
+
+    def test_counts_lookups_per_key(self, counters):
+        t("nav.home")
+        t("nav.home")
+        t("errors.page_load_failed", error="x")
+        assert counters.lookups["nav.home"] == 2
+        assert counters.stats(top=1)["hot_keys"] == {"nav.home": 2}
+
+    def test_counts_misses_per_language(self, counters):
+        t("nav.nonexistent")
+        set_language("es")
+        try:
+            t("nav.nonexistent")
+            t("nav.nonexistent")
+        finally:
+            set_language("en")
+        assert counters.stats()["misses"] == {
+            "en": {"nav.nonexistent": 1}, "es": {"nav.nonexistent": 2},
+        }
+
+    def test_section_lookup_is_not_a_miss(self, counters):
+        t("nav")
+        assert counters.misses == {}
+
+    def test_counts_interpolation_failures(self, counters):
+        assert t("errors.page_load_failed", wrong="x").endswith("{error}")
+        assert counters.stats()["interpolation_failures"] == {
+            "en": {"errors.page_load_failed": 1},
+        }
+
+    def test_counts_failures_on_uncompiled_path(self, counters):
+        from app.i18n import loader
+        catalog = loader.Catalog("en", {"greet": {"who": "x"}})
+        # A section renders as its dict; "{'who': 'x'}" has a {'who'} field
+        assert loader._lookup_uncompiled(catalog, "greet", {"a": 1}) == "{'who': 'x'}"
+        assert counters.failures == {"en": {"greet": 1}}
+
+    def test_disabled_counts_nothing(self, monkeypatch):
+        from app.i18n import loader
+        monkeypatch.setattr(loader, "_TELEMETRY", None)
+        t("nav.home")
+        assert loader.telemetry() is None
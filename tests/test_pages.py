@@ -71,3 +71,202 @@ async def test_pages_contain_navigation(client):
         assert "Task Manager" in resp.text, f"Nav missing on {path}"
         assert "picocss" in resp.text.lower() or "pico" in resp.text.lower(), \
             f"PicoCSS missing on {path}"
+
+
+PAGE_PATHS = ["/app", "/app/tasks", "/app/all", "/app/categories",
+              "/app/tags", "/app/next", "/app/notifications", "/app/settings"]
+
+
+@pytest.mark.asyncio
+async def test_nav_links_are_boosted(client):
+    resp = await client.get("/app")
+    assert 'hx-boost="true"' in resp.text
+    assert 'hx-target="#content"' in resp.text
+
+
+@pytest.mark.asyncio
+async def test_htmx_navigation_gets_content_only(client):
+    for path in PAGE_PATHS:
+        full = await client.get(path)
+        resp = await client.get(path, headers={"HX-Request": "true"})
+        assert resp.status_code == 200
+        assert "<html" not in resp.text, f"Full shell sent on {path}"
+        assert "theme-toggle" not in resp.text
+        assert "<title>" in resp.text
+        assert len(resp.content) < len(full.content)
+
+
+@pytest.mark.asyncio
+async def test_history_restore_gets_full_page(client):
+    resp = await client.get(
+        "/app/tasks",
+        headers={"HX-Request": "true", "HX-History-Restore-Request": "true"},
+    )
+    assert "<html" in resp.text
+    assert "theme-toggle" in resp.text
+
+
+@pytest.mark.asyncio
+async def test_page_responses_vary_on_htmx_headers(client):
+    resp = await client.get("/app")
+    assert "HX-Request" in resp.headers["vary"]
+
+
+@pytest.fixture
+def ssr(monkeypatch):
+    import app.app as app_module
+    monkeypatch.setattr(app_module, "SSR_FIRST_PAINT", True)
+    monkeypatch.setattr(app_module, "SSR_BUDGET_SECONDS", 0.5)
+    return app_module
+
+
+@pytest.mark.asyncio
+async def test_pages_lazy_load_by_default(client, mock_backend):
+    resp = await client.get("/app/tasks")
+    assert 'hx-trigger="load, refresh"' in resp.text
+    mock_backend.get_tasks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ssr_embeds_initial_fragments(client, mock_backend, ssr):
+    resp = await client.get("/app/tasks")
+    assert "Test task" in resp.text
+    assert 'hx-trigger="load, refresh"' not in resp.text
+
+    resp = await client.get("/app/categories")
+    assert 'id="category-1"' in resp.text
+
+    resp = await client.get("/app/all")
+    assert 'id="task-1"' in resp.text
+    assert 'hx-trigger="load"' not in resp.text
+
+    resp = await client.get("/app/next")
+    assert 'id="task-1"' in resp.text
+    assert 'hx-trigger="load"' not in resp.text
+
+
+@pytest.mark.asyncio
+async def test_ssr_falls_back_to_lazy_when_backend_is_slow(client, mock_backend, ssr, monkeypatch):
+    import asyncio
+
+    async def slow(*args, **kwargs):
+        await asyncio.sleep(1)
+        return []
+
+    monkeypatch.setattr(ssr, "SSR_BUDGET_SECONDS", 0.05)
+    mock_backend.get_next_tasks.side_effect = slow
+    resp = await client.get("/app/next")
+    assert resp.status_code == 200
+    # Upcoming missed the budget and loads lazily; overdue made it inline
+    assert 'hx-get="/api/tasks/next?hours=48"' in resp.text
+    assert 'hx-get="/app/next/overdue"' not in resp.text
+
+
+@pytest.mark.asyncio
+async def test_ssr_failure_falls_back_to_lazy_placeholder(client, mock_backend, ssr):
+    from app.utils.backend import BackendUnavailableError
+    mock_backend.get_tasks.side_effect = BackendUnavailableError("down")
+    mock_backend.get_categories.side_effect = RuntimeError("boom")
+
+    resp = await client.get("/app/tasks")
+    assert 'hx-trigger="load, refresh"' in resp.text
+    assert "error-message" not in resp.text
+
+    resp = await client.get("/app/categories")
+    assert 'hx-trigger="load, refresh"' in resp.text
+    assert "boom" not in resp.text
+
+    resp = await client.get("/app/all")
+    assert 'hx-get="/app/all/tasks"' in resp.text
+
+    mock_backend.get_next_tasks.side_effect = RuntimeError("boom")
+    resp = await client.get("/app/next")
+    assert 'hx-get="/api/tasks/next?hours=48"' in resp.text
+    assert "boom" not in resp.text
+
+
+@pytest.fixture
+def streaming(monkeypatch):
+    import app.app as app_module
+    monkeypatch.setattr(app_module, "STREAM_PAGES", True)
+    monkeypatch.setattr(app_module, "STREAM_BUDGET_SECONDS", 0.5)
+    return app_module
+
+
+@pytest.mark.asyncio
+async def test_streamed_pages_fill_sections(client, mock_backend, streaming):
+    resp = await client.get("/app/next")
+    assert resp.status_code == 200
+    assert '<template id="fill-upcoming-tasks">' in resp.text
+    assert '<template id="fill-overdue-tasks">' in resp.text
+    assert 'id="task-1"' in resp.text
+    assert resp.text.rstrip().endswith("</html>")
+
+    resp = await client.get("/app/settings")
+    assert '<template id="fill-system-info">' in resp.text
+
+
+@pytest.mark.asyncio
+async def test_streamed_section_past_budget_stays_lazy(client, mock_backend, streaming, monkeypatch):
+    import asyncio
+
+    async def slow(*args, **kwargs):
+        await asyncio.sleep(1)
+        return []
+
+    monkeypatch.setattr(streaming, "STREAM_BUDGET_SECONDS", 0.05)
+    mock_backend.get_overdue_tasks.side_effect = slow
+    resp = await client.get("/app/next")
+    assert '<template id="fill-upcoming-tasks">' in resp.text
+    assert "fill-overdue-tasks" not in resp.text
+    assert 'hx-get="/app/next/overdue"' in resp.text
+
+
+@pytest.mark.asyncio
+async def test_streaming_skipped_for_htmx_navigation(client, mock_backend, streaming):
+    resp = await client.get("/app/next", headers={"HX-Request": "true"})
+    assert "<template" not in resp.text
+    assert 'hx-trigger="load"' in resp.text
+
+
+@pytest.mark.asyncio
+async def test_language_cookie_selects_catalog(client):
+    spanish = await client.get("/app/tasks", headers={"Cookie": "lang=es"})
+    english = await client.get("/app/tasks")
+    assert "Inicio" in spanish.text
+    assert "Inicio" not in english.text
+
+
+@pytest.mark.asyncio
+async def test_accept_language_selects_catalog(client):
+    resp = await client.get("/app/tasks", headers={"Accept-Language": "es-CL,es;q=0.9"})
+    assert "Inicio" in resp.text
+
+
+@pytest.mark.asyncio
+async def test_concurrent_languages_do_not_leak(client):
+    import asyncio
+    responses = await asyncio.gather(*[
+        client.get("/app/tasks", headers={"Cookie": "lang=es" if i % 2 else "lang=en"})
+        for i in range(10)
+    ])
+    for i, resp in enumerate(responses):
+        assert ("Inicio" in resp.text) == bool(i % 2)
+
+
+@pytest.mark.asyncio
+async def test_general_settings_sets_language_cookie(client):
+    from app.i18n import set_language
+    try:
+        resp = await client.put(
+            "/app/settings/general", data={"language": "es"},
+            headers={"HX-Request": "true"},
+        )
+        assert resp.status_code == 200
+        assert "lang=es" in resp.headers["set-cookie"]
+        # Other clients (no cookie) keep the process default
+        client.cookies.clear()
+        other = await client.get("/app/tasks")
+        assert "Inicio" not in other.text
+    finally:
+        set_language("en")
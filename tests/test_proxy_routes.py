@@ -28,7 +28,7 @@ async def test_get_tasks_with_status_param(client, mock_backend):
     """GET /api/tasks?status=pending passes status to backend."""
     resp = await client.get("/api/tasks?status=pending")
     assert resp.status_code == 200
-    mock_backend.get_tasks.assert_called_once_with(status="pending")
+    mock_backend.get_tasks.assert_called_once_with(status="pending", limit=None)
 
 
 @pytest.mark.asyncio
@@ -40,6 +40,8 @@ async def test_get_tasks_with_limit(client, mock_backend):
     # Should only contain one task card (count article ids)
     assert 'id="task-1"' in resp.text
     assert 'id="task-2"' not in resp.text
+    # ...and the limit is pushed down to the backend
+    mock_backend.get_tasks.assert_called_once_with(status=None, limit=1)
 
 
 @pytest.mark.asyncio
@@ -99,3 +101,144 @@ async def test_backend_unavailable_shows_error(client, mock_backend):
     resp = await client.get("/api/tasks")
     assert resp.status_code == 200  # HTMX expects 200 with error HTML
     assert "unreachable" in resp.text.lower()
+
+
+# ── Quick stats fragment ─────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_quick_stats_renders_all_sections(client, mock_backend):
+    """GET /app/stats fetches the three summaries and renders them."""
+    resp = await client.get("/app/stats")
+    assert resp.status_code == 200
+    assert "5 active, 3 completed" in resp.text
+    assert mock_backend.get_views_summary.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_quick_stats_partial_failure(client, mock_backend):
+    """One failing summary renders a placeholder, not an error block."""
+    from app.utils.backend import BackendUnavailableError
+
+    async def summary(kind):
+        if kind == "tags-summary":
+            raise BackendUnavailableError("down")
+        return [{"key": "pending", "count": 5}, {"key": "completed", "count": 3}]
+
+    mock_backend.get_views_summary.side_effect = summary
+    resp = await client.get("/app/stats")
+    assert resp.status_code == 200
+    assert "5 active, 3 completed" in resp.text
+    assert "unavailable" in resp.text
+    assert "error-message" not in resp.text
+
+
+@pytest.mark.asyncio
+async def test_quick_stats_slow_summary_hits_deadline(client, mock_backend, monkeypatch):
+    """A summary that misses the shared deadline is rendered as a placeholder."""
+    import asyncio
+    import app.app as app_module
+    monkeypatch.setattr(app_module, "STATS_TIMEOUT_SECONDS", 0.05)
+
+    async def summary(kind):
+        if kind == "categories-summary":
+            await asyncio.sleep(5)
+        return [{"key": "pending", "count": 5}, {"key": "completed", "count": 3}]
+
+    mock_backend.get_views_summary.side_effect = summary
+    resp = await client.get("/app/stats")
+    assert resp.status_code == 200
+    assert "5 active, 3 completed" in resp.text
+    assert "unavailable" in resp.text
+
+
+@pytest.mark.asyncio
+async def test_quick_stats_total_outage(client, mock_backend):
+    """When every summary fails the whole block is an error message."""
+    from app.utils.backend import BackendUnavailableError
+    mock_backend.get_views_summary.side_effect = BackendUnavailableError("down")
+    resp = await client.get("/app/stats")
+    assert resp.status_code == 200
+    assert "error-message" in resp.text
+
+
+# ── System info fragment ─────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_system_info_counts_from_summaries(client, mock_backend):
+    """Category/tag counts come from the views summaries, not full lists."""
+    resp = await client.get("/app/settings/system-info")
+    assert resp.status_code == 200
+    assert "healthy" in resp.text
+    mock_backend.get_categories.assert_not_called()
+    mock_backend.get_tags.assert_not_called()
+    kinds = {c.args[0] for c in mock_backend.get_views_summary.call_args_list}
+    assert kinds == {"status-summary", "categories-summary", "tags-summary"}
+
+
+@pytest.mark.asyncio
+async def test_system_info_slow_source_renders_unknown(client, mock_backend, monkeypatch):
+    """A source that misses its per-call budget renders as unknown."""
+    import asyncio
+    import app.app as app_module
+    monkeypatch.setattr(app_module, "SYSTEM_INFO_CALL_TIMEOUT_SECONDS", 0.05)
+
+    async def slow_settings():
+        await asyncio.sleep(5)
+
+    mock_backend.get_settings.side_effect = slow_settings
+    resp = await client.get("/app/settings/system-info")
+    assert resp.status_code == 200
+    assert "healthy" in resp.text
+    assert "unknown" in resp.text
+    assert "error-message" not in resp.text
+
+
+HX = {"HX-Request": "true"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", [
+    "/app/tags/cloud", "/api/categories", "/app/notifications/status", "/app/stats",
+])
+async def test_polled_fragments_revalidate_with_etag(client, mock_backend, path):
+    """Unchanged fragments answer If-None-Match with 304."""
+    first = await client.get(path, headers=HX)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    again = await client.get(path, headers={**HX, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+@pytest.mark.asyncio
+async def test_fragment_etag_changes_with_data(client, mock_backend):
+    first = await client.get("/api/categories", headers=HX)
+    mock_backend.get_categories.return_value = [{"id": 2, "name": "Home"}]
+    resp = await client.get(
+        "/api/categories", headers={**HX, "If-None-Match": first.headers["etag"]}
+    )
+    assert resp.status_code == 200
+    assert "Home" in resp.text
+    assert resp.headers["etag"] != first.headers["etag"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+async def test_fragment_etag_is_weak_and_stable_across_304(client, encoding):
+    headers = {**HX, "Accept-Encoding": encoding}
+    first = await client.get("/api/categories", headers=headers)
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    again = await client.get("/api/categories", headers={**headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_non_htmx_fragment_request_unchanged(client):
+    resp = await client.get("/api/categories")
+    assert resp.status_code == 200
+    assert "etag" not in resp.headers
+    assert "Work" in resp.text
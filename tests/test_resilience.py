@@ -0,0 +1,114 @@
+"""Tests for the circuit breaker."""
+
+from app.utils.resilience import CircuitBreaker, LatencyTracker, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_single_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.snapshot()["retry_in"] == 10
+
+
+def test_released_probe_frees_slot():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_zero_threshold_disables_breaker():
+    breaker = CircuitBreaker(failure_threshold=0)
+    for _ in range(10):
+        breaker.record_failure()
+    assert breaker.allow()
+
+
+# ── Retry policy ─────────────────────────────────────────────────────
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(max_attempts=5, base_delay=0.1, max_delay=0.3, rng=lambda: 1.0)
+    assert policy.backoff(1) == 0.1
+    assert policy.backoff(2) == 0.2
+    assert policy.backoff(5) == 0.3
+    jittered = RetryPolicy(base_delay=0.1, rng=lambda: 0.5)
+    assert jittered.backoff(1) == 0.05
+
+
+def test_retry_budget_limits_retries():
+    policy = RetryPolicy(max_attempts=3, budget_ratio=0.5, max_tokens=2)
+    assert policy.try_spend()
+    assert policy.try_spend()
+    assert not policy.try_spend()
+    policy.deposit()
+    policy.deposit()
+    assert policy.try_spend()
+    assert policy.snapshot()["budget_exhausted"] == 1
+
+
+def test_latency_percentile_needs_samples():
+    tracker = LatencyTracker(min_samples=10)
+    for i in range(1, 10):
+        tracker.record(i / 100)
+    assert tracker.percentile(0.95) is None
+    for i in range(10, 101):
+        tracker.record(i / 100)
+    assert tracker.percentile(0.95) == 0.96
+
+
+def test_latency_is_tracked_per_key():
+    tracker = LatencyTracker(min_samples=2)
+    for _ in range(5):
+        tracker.record(0.001, "/healthz")
+        tracker.record(0.5, "/api/tasks")
+    assert tracker.percentile(0.95, "/healthz") == 0.001
+    assert tracker.percentile(0.95, "/api/tasks") == 0.5
+    assert tracker.percentile(0.95, "/api/tags") is None
@@ -0,0 +1,45 @@
+"""Tests for the fast-path serializer — output must match fastcore's to_xml."""
+
+import pytest
+from fasthtml import ft
+from fasthtml.common import NotStr, to_xml
+
+from app.utils.components import task_card
+from app.utils.serializer import fast_xml
+from tests.conftest import SAMPLE_TASK, SAMPLE_COMPLETED_TASK
+
+
+CASES = [
+    ft.Div(),
+    ft.Div(None),
+    ft.P(3),
+    ft.P("<b> & 'quotes' \"double\""),
+    ft.Span(NotStr("<em>raw</em>")),
+    ft.Div(ft.P("a"), None, "text <", 5, ft.Span(NotStr("<b>"))),
+    ft.Button("Go", disabled=True, hidden=False, tabindex=0, data_x=1, ignored_="x"),
+    ft.Div(title="say \"hi\"", alt="it's \"both\""),
+    ft.Div(ft.Pre("  keep\n  spacing"), ft.Div(ft.P("edit"), contenteditable="true")),
+    ft.Div(style={"color": "red"}, cls=["a", "b"], hx_vals={"k": 1}),
+    ft.Section(ft.Article(ft.H4("nested"), ft.Ul(ft.Li("x")))),
+    (ft.P("a"), "loose <text>", ft.Div()),
+    task_card(SAMPLE_TASK, {1: "Work"}, {1: "urgent", 2: "home"}),
+    task_card(SAMPLE_COMPLETED_TASK),
+]
+
+
+@pytest.mark.parametrize("element", CASES)
+@pytest.mark.parametrize("indent", [True, False])
+def test_matches_to_xml(element, indent):
+    assert fast_xml(element, indent=indent) == to_xml(element, indent=indent)
+
+
+def test_non_element_input_matches_to_xml():
+    assert fast_xml("plain") == to_xml("plain")
+    assert fast_xml(None) == to_xml(None)
+
+
+def test_whole_page_matches_to_xml():
+    """Canary for fastcore upgrades: a full page mixes fast and generic nodes."""
+    from app.utils.components import _shell_tree
+    page = _shell_tree(ft.Div(*[task_card(SAMPLE_TASK, {1: "Work"}, {1: "urgent"})] * 3))
+    assert fast_xml(page) == to_xml(page)
@@ -0,0 +1,160 @@
+"""Tests for the fingerprinted static asset pipeline."""
+
+import pytest
+
+from app.utils.static import assets
+
+
+@pytest.mark.asyncio
+async def test_pages_reference_fingerprinted_assets(client):
+    resp = await client.get("/app")
+    assert assets.url("app.css") in resp.text
+    assert assets.url("theme.js") in resp.text
+    assert assets.url("htmx-events.js") in resp.text
+    assert 'rel="preload"' in resp.text
+    # Styles and scripts are no longer inlined into every page
+    assert "<style>" not in resp.text
+    assert "function toggleTheme" not in resp.text
+
+
+@pytest.mark.asyncio
+async def test_js_strings_travel_in_data_attributes(client):
+    resp = await client.get("/app")
+    assert 'data-label-light="Switch to light mode"' in resp.text
+    assert 'data-htmx-error="An error occurred. Please try again."' in resp.text
+
+
+@pytest.mark.asyncio
+async def test_asset_served_with_immutable_caching(client):
+    resp = await client.get(assets.url("app.css"))
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/css")
+    assert "immutable" in resp.headers["cache-control"]
+    assert "--spacing" in resp.text
+
+
+@pytest.mark.asyncio
+async def test_asset_revalidation_returns_304(client):
+    url = assets.url("theme.js")
+    etag = (await client.get(url)).headers["etag"]
+    resp = await client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_unknown_or_stale_asset_is_404(client):
+    resp = await client.get("/static/app.000000000000.css")
+    assert resp.status_code == 404
+
+
+def test_filename_changes_with_content():
+    from app.utils.static import Asset
+    assert Asset("a.css", b"x").filename != Asset("a.css", b"y").filename
+
+
+def _registry(tmp_path, files):
+    from app.utils.static import AssetRegistry
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return AssetRegistry(tmp_path)
+
+
+def _request(**headers):
+    from starlette.requests import Request
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.lower().replace("_", "-").encode(), v.encode())
+                    for k, v in headers.items()],
+    })
+
+
+def test_compressible_assets_get_gzip_variant(tmp_path):
+    import gzip
+    body = b"body { color: red; }\n" * 100
+    registry = _registry(tmp_path, {"big.css": body, "tiny.css": b"a{}"})
+    big = registry._by_name["big.css"]
+    assert gzip.decompress(big.variants["gzip"]) == body
+    # Tiny files are not worth compressing
+    assert registry._by_name["tiny.css"].variants == {}
+
+
+def test_variant_negotiation_and_vary(tmp_path):
+    import gzip
+    body = b"body { color: red; }\n" * 100
+    registry = _registry(tmp_path, {"big.css": body})
+    filename = registry._by_name["big.css"].filename
+
+    resp = registry.response(_request(accept_encoding="gzip, deflate"), filename)
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(resp.body) == body
+
+    plain = registry.response(_request(), filename)
+    assert "content-encoding" not in plain.headers
+    assert plain.body == body
+    # Each representation carries its own strong ETag
+    assert plain.headers["etag"] != resp.headers["etag"]
+    assert not plain.headers["etag"].startswith("W/")
+
+
+def test_refused_encoding_is_not_served(tmp_path):
+    registry = _registry(tmp_path, {"big.css": b"p { margin: 0; }\n" * 100})
+    filename = registry._by_name["big.css"].filename
+    resp = registry.response(_request(accept_encoding="gzip;q=0"), filename)
+    assert "content-encoding" not in resp.headers
+
+
+def test_variant_revalidation_matches_its_own_etag(tmp_path):
+    registry = _registry(tmp_path, {"big.css": b"p { margin: 0; }\n" * 100})
+    filename = registry._by_name["big.css"].filename
+    etag = registry.response(_request(accept_encoding="gzip"), filename).headers["etag"]
+    resp = registry.response(
+        _request(accept_encoding="gzip", if_none_match=f'"other", {etag}'), filename
+    )
+    assert resp.status_code == 304
+
+
+def test_vendored_libraries_never_use_the_cdn(tmp_path):
+    registry = _registry(tmp_path, {"app.css": b"a{}"})
+    assert registry.vendor_url("vendor/htmx.min.js") == "/static/vendor/htmx.min.js"
+
+    registry = _registry(tmp_path, {"vendor/htmx.min.js": b"/* htmx */"})
+    assert registry.vendor_url("vendor/htmx.min.js").startswith("/static/vendor/htmx.")
+
+
+def test_committed_vendored_libraries_match_their_pins():
+    assets.check_vendored()
+    assert assets.vendor_url("vendor/htmx.min.js") == assets.url("vendor/htmx.min.js")
+
+
+def test_missing_vendored_library_fails_startup_check(tmp_path):
+    registry = _registry(tmp_path, {"app.css": b"a{}"})
+    with pytest.raises(RuntimeError, match="vendor/htmx.min.js is missing"):
+        registry.check_vendored()
+
+
+def test_vendored_files_must_match_their_pins(tmp_path, monkeypatch):
+    from app.utils import static
+    good, bad = b"/* htmx */", b"/* tampered */"
+    monkeypatch.setattr(static, "VENDOR", {
+        "vendor/htmx.min.js": ("https://example.invalid/htmx.js", static.integrity(good)),
+    })
+    static.verify("vendor/htmx.min.js", good)
+    with pytest.raises(ValueError, match="digest mismatch"):
+        static.verify("vendor/htmx.min.js", bad)
+
+    _registry(tmp_path, {"vendor/htmx.min.js": good}).check_vendored()
+    with pytest.raises(RuntimeError, match="digest mismatch"):
+        _registry(tmp_path, {"vendor/htmx.min.js": bad}).check_vendored()
+
+
+def test_integrity_matches_sri_format():
+    from app.utils.static import integrity
+    # echo -n "alert('Hello, world.');" | openssl dgst -sha384 -binary | base64
+    assert integrity(b"alert('Hello, world.');") == (
+        "sha384-H8BRh8j48O9oYatfu5AZzq6A9RINhZO5H16dQZngK7T62em8MUt1FLm52t+eX6xO"
+    )